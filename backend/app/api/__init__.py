@@ -1,30 +1,55 @@
+from importlib import import_module
+
+from flask import g
+from flask_jwt_extended import get_jwt_identity
+
 from app.extensions import api, configure_error_handlers
-from .auth import api as auth_ns
-from .admin import api as admin_ns
-from .admin_analytics import api as admin_analytics_ns
-from .admin_monitoring import api as admin_monitoring_ns
-from .employees import api as employees_ns
-from .users import api as users_ns
-from .rides import api as rides_ns
-from .reservations import api as reservations_ns
-from .notifications import api as notifications_ns
-from .ride_debug import api as ride_debug_ns
-from .ai_matches import api as ai_matches_ns
+from app.utils.serialization import output_json
+
+# Namespace modules and their mount paths, imported when the API is initialised
+NAMESPACES = (
+    ('auth', '/auth'),
+    ('admin', '/admin'),
+    ('admin_analytics', '/admin/analytics'),
+    ('admin_monitoring', '/admin/monitoring'),
+    ('employees', '/employees'),
+    ('users', '/users'),
+    ('rides', '/rides'),
+    ('reservations', '/reservations'),
+    ('notifications', '/notifications'),
+    ('ride_debug', '/ride-debug'),
+    ('ai_matches', '/ai'),
+)
+
+
+def current_employee_id():
+    """Return the authenticated employee ID, parsed once per request."""
+    if '_employee_id' not in g:
+        g._employee_id = int(get_jwt_identity())
+    return g._employee_id
+
+
+def _reset_current_employee_id():
+    # g outlives a request when an app context is already pushed (e.g. tests)
+    g.pop('_employee_id', None)
 
 
 def init_api(app):
+    # init_api may run again for the same app (e.g. repeated factory calls)
+    if app.extensions.get('carpool_api_ready'):
+        return
+    
     # Configure error handlers for standardized responses
     configure_error_handlers(api)
+    api.representations['application/json'] = output_json
+    app.before_request(_reset_current_employee_id)
     
-    api.add_namespace(auth_ns, path="/auth")
-    api.add_namespace(admin_ns, path="/admin")
-    api.add_namespace(admin_analytics_ns, path="/admin/analytics")
-    api.add_namespace(admin_monitoring_ns, path="/admin/monitoring")
-    api.add_namespace(employees_ns, path="/employees")
-    api.add_namespace(users_ns, path="/users")
-    api.add_namespace(rides_ns, path="/rides")
-    api.add_namespace(reservations_ns, path="/reservations")
-    api.add_namespace(notifications_ns, path="/notifications")
-    api.add_namespace(ride_debug_ns, path="/ride-debug")
-    api.add_namespace(ai_matches_ns, path="/ai")
+    # The Api object is process-wide: register namespaces only once, otherwise
+    # their resources are re-added to the first app bound to it
+    registered = set(api.namespaces)
+    for module_name, path in NAMESPACES:
+        namespace = import_module(f'{__name__}.{module_name}').api
+        if namespace not in registered:
+            api.add_namespace(namespace, path=path)
     api.init_app(app)
+    app.extensions['carpool_api_ready'] = True
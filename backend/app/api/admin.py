@@ -1,19 +1,31 @@
+from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from datetime import datetime, timedelta
+from sqlalchemy import Date, cast, func, or_, select
+from sqlalchemy.orm import undefer_group
 
-from app.extensions import db
+from app.api import current_employee_id
+from app.extensions import db, cache
 from app.models import Employee, Ride, Reservation
 from app.models.system_event import SystemEvent
-from app.services.system_metrics_service import (
-    get_total_users,
-    get_active_rides as get_service_active_rides,
-    get_total_rides,
-    get_total_reservations,
-)
+from app.services.system_metrics_service import get_platform_totals
 from app.services.system_health_service import get_system_health
 
 api = Namespace('admin', description='Admin operations and statistics')
 
+# Dashboard stats cache (dropped when rides or reservations change, or employees
+# are added or removed)
+ADMIN_STATS_CACHE_KEY = 'admin:stats'
+ADMIN_STATS_CACHE_TTL = 30  # seconds
+
+# Location patterns per country for the top-routes filter ('%tunis%' also
+# matches 'tunisia')
+TOP_ROUTE_COUNTRY_PATTERNS = {
+    'tunisia': ('%tunis%',),
+    'france': ('%france%',),
+}
+
 # Error response model
 error_response = api.model('ErrorResponse', {
     'error': fields.String(description='Error code (e.g., VALIDATION_ERROR, NOT_FOUND, UNAUTHORIZED, FORBIDDEN, INTERNAL_ERROR)'),
@@ -44,8 +56,8 @@ toggle_status_response = api.model('ToggleStatusResponse', {
 
 def require_admin():
     """Helper function to verify current user is admin"""
-    current_user_id = get_jwt_identity()
-    current_user = Employee.query.get(current_user_id)
+    current_user_id = current_employee_id()
+    current_user = db.session.get(Employee, current_user_id)
     if not current_user or current_user.role != 'admin':
         return {'error': 'FORBIDDEN', 'message': 'Admin access required'}, 403
     return current_user
@@ -60,6 +72,31 @@ dashboard_stats_response = api.model('DashboardStatsResponse', {
 })
 
 
+@cache.cached(ADMIN_STATS_CACHE_KEY, ADMIN_STATS_CACHE_TTL)
+def get_dashboard_stats():
+    """Compute aggregated platform statistics for the dashboard"""
+    # Use shared metrics service for consistency (single aggregated query)
+    totals = get_platform_totals()
+    total_reservations = totals['total_reservations']
+    
+    # Calculate CO2 saved: each reservation saves ~2.5kg
+    co2_saved_kg = int(total_reservations * 2.5)
+    
+    return {
+        'total_users': totals['total_users'],
+        'active_users': totals['active_rides'],  # Using active_rides as active_users for consistency
+        'total_rides': totals['total_rides'],
+        'total_reservations': total_reservations,
+        'co2_saved_kg': co2_saved_kg
+    }
+
+
+cache.invalidate_on((Ride, Reservation), ADMIN_STATS_CACHE_KEY)
+# Employees only enter the stats as a head count, so edits to existing ones
+# (last_seen_at heartbeats, status toggles, password changes) keep the entry
+cache.invalidate_on((Employee,), ADMIN_STATS_CACHE_KEY, events=('insert', 'delete'))
+
+
 @api.route('/stats')
 class AdminStats(Resource):
     @jwt_required()
@@ -77,22 +114,7 @@ class AdminStats(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        # Use shared metrics service for consistency
-        total_users = get_total_users()
-        active_rides = get_service_active_rides()
-        total_rides = get_total_rides()
-        total_reservations = get_total_reservations()
-        
-        # Calculate CO2 saved: each reservation saves ~2.5kg
-        co2_saved_kg = int(total_reservations * 2.5)
-        
-        return {
-            'total_users': total_users,
-            'active_users': active_rides,  # Using active_rides as active_users for consistency
-            'total_rides': total_rides,
-            'total_reservations': total_reservations,
-            'co2_saved_kg': co2_saved_kg
-        }
+        return get_dashboard_stats()
 
 
 @api.route('/users')
@@ -105,22 +127,27 @@ class AdminUsersList(Resource):
             401: ('Unauthorized - JWT required', error_response)
         }
     )
-    @api.marshal_list_with(user_response)
     def get(self):
         """Get all employees list (excludes admins)"""
         result = require_admin()
         if isinstance(result, tuple):  # Error response
             return result
         
-        current_user_id = get_jwt_identity()
-        
-        # Only return employees (role='employee'), exclude all admins including current user
-        employees = Employee.query.filter(
-            Employee.role == 'employee',
-            Employee.id != current_user_id
-        ).all()
+        current_user_id = current_employee_id()
+        
+        # Only return employees (role='employee'), exclude all admins including current user.
+        # Only the UserResponse columns are selected and rows are returned as-is.
+        rows = db.session.execute(
+            select(
+                Employee.id, Employee.name, Employee.email,
+                Employee.status, Employee.role, Employee.department
+            ).where(
+                Employee.role == 'employee',
+                Employee.id != current_user_id
+            )
+        ).mappings()
         
-        return [emp.to_dict() for emp in employees]
+        return [dict(row) for row in rows]
 
 
 @api.route('/users/<int:id>/status')
@@ -151,7 +178,7 @@ class AdminUserStatus(Resource):
         if new_status not in ['active', 'frozen']:
             return {'error': 'VALIDATION_ERROR', 'message': 'Status must be active or frozen'}, 400
         
-        user = Employee.query.get(id)
+        user = db.session.get(Employee, id)
         if not user:
             return {'error': 'NOT_FOUND', 'message': 'User not found'}, 404
         
@@ -178,7 +205,7 @@ class AdminUserDetails(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        user = Employee.query.get(id)
+        user = db.session.get(Employee, id, options=[undefer_group('stats')])
         if not user:
             return {'error': 'NOT_FOUND', 'message': 'User not found'}, 404
         
@@ -192,18 +219,17 @@ class AdminUserDetails(Resource):
             }
         
         # Calculate usage statistics
-        rides_offered = user.offered_rides.count()
-        reservations_made = user.reservations.count()
-        
-        # Completed trips (rides where user was driver and status is completed)
-        completed_trips = user.offered_rides.filter(
-            Ride.status == 'completed'
-        ).count()
-        
-        # Cancelled trips (rides where user was driver and status is CANCELLED)
-        cancelled_trips = user.offered_rides.filter(
-            Ride.status == 'CANCELLED'
-        ).count()
+        rides_offered = user.rides_offered_count
+        reservations_made = user.bookings_count
+        
+        # Completed and cancelled trips (rides where user was driver), counted
+        # in one pass over the driver's rides
+        completed_trips, cancelled_trips = db.session.execute(
+            select(
+                func.count().filter(Ride.status == 'completed'),
+                func.count().filter(Ride.status == 'CANCELLED')
+            ).where(Ride.driver_id == user.id)
+        ).one()
         
         # Build response
         response = {
@@ -247,12 +273,11 @@ class AdminUserActivity(Resource):
             return result
         
         # Verify user exists
-        user = Employee.query.get(id)
+        user = db.session.get(Employee, id)
         if not user:
             return {'error': 'NOT_FOUND', 'message': 'User not found'}, 404
         
         # Get pagination parameters
-        from flask import request
         try:
             limit = int(request.args.get('limit', 20))
             limit = max(1, min(100, limit))  # Clamp between 1 and 100
@@ -306,7 +331,6 @@ class AdminEvents(Resource):
             return result
         
         # Get limit parameter with validation
-        from flask import request
         try:
             limit = int(request.args.get('limit', 20))
             limit = max(1, min(100, limit))  # Clamp between 1 and 100
@@ -398,8 +422,6 @@ class AdminDashboardMetrics(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        from datetime import datetime, timedelta
-        
         # Active rides (in_progress or active status)
         active_rides = Ride.query.filter(
             Ride.status.in_(['in_progress', 'active'])
@@ -454,8 +476,6 @@ class AdminAnalyticsRideStatus(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        from sqlalchemy import func
-        
         # Query rides grouped by status
         status_counts = db.session.query(
             Ride.status,
@@ -487,8 +507,6 @@ class AdminAnalyticsRidesOverTime(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        from sqlalchemy import func, cast, Date
-        
         # Query rides grouped by date
         rides_by_date = db.session.query(
             cast(Ride.created_at, Date).label('date'),
@@ -524,9 +542,6 @@ class AdminAnalyticsTopRoutes(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        from sqlalchemy import func, or_
-        from flask import request
-        
         country = request.args.get('country', '').lower()
         
         # Build query
@@ -536,22 +551,15 @@ class AdminAnalyticsTopRoutes(Resource):
             func.count(Ride.id).label('rides')
         )
         
-        # Apply country filter if specified
-        if country == 'tunisia':
+        # Apply country filter if specified (ILIKE is served by the trigram indexes)
+        patterns = TOP_ROUTE_COUNTRY_PATTERNS.get(country)
+        if patterns:
             query = query.filter(
-                or_(
-                    Ride.origin.ilike('%tunisia%'),
-                    Ride.origin.ilike('%tunis%'),
-                    Ride.destination.ilike('%tunisia%'),
-                    Ride.destination.ilike('%tunis%')
-                )
-            )
-        elif country == 'france':
-            query = query.filter(
-                or_(
-                    Ride.origin.ilike('%france%'),
-                    Ride.destination.ilike('%france%')
-                )
+                or_(*(
+                    column.ilike(pattern)
+                    for pattern in patterns
+                    for column in (Ride.origin, Ride.destination)
+                ))
             )
         
         # Execute query
@@ -589,8 +597,6 @@ class AdminAnalyticsUserGrowth(Resource):
         if isinstance(result, tuple):  # Error response
             return result
         
-        from sqlalchemy import func, cast, Date
-        
         # Query employees grouped by registration date
         users_by_date = db.session.query(
             cast(Employee.created_at, Date).label('date'),
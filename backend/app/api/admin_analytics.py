@@ -1,7 +1,11 @@
 """Admin Analytics API - Real-time dashboard metrics and trends."""
 
+from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+
+from app.api import current_employee_id
+from app.extensions import db
 from app.models.employee import Employee
 from app.services.system_metrics_service import get_dashboard_metrics
 from app.services.admin_analytics_service import AdminAnalyticsService
@@ -64,8 +68,8 @@ error_response = api.model('ErrorResponse', {
 
 def require_admin():
     """Verify current user is admin."""
-    current_user_id = get_jwt_identity()
-    employee = Employee.query.get(current_user_id)
+    current_user_id = current_employee_id()
+    employee = db.session.get(Employee, current_user_id)
 
     if not employee:
         return {'error': 'NOT_FOUND', 'message': 'User not found'}, 404
@@ -123,7 +127,6 @@ class SystemTrends(Resource):
             return result
 
         # Get days parameter with validation
-        from flask import request
         try:
             days = int(request.args.get('days', 7))
         except (ValueError, TypeError):
@@ -202,7 +205,6 @@ class RecentActivity(Resource):
         if isinstance(result, tuple):
             return result
 
-        from flask import request
         try:
             limit = int(request.args.get('limit', 10))
         except (ValueError, TypeError):
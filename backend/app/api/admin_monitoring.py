@@ -1,7 +1,10 @@
 """Admin Monitoring API - Real-time system monitoring endpoints."""
 
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+
+from app.api import current_employee_id
+from app.extensions import db
 from app.models import Employee
 from app.services.admin_monitoring_service import (
     get_monitoring_overview,
@@ -54,8 +57,8 @@ heartbeat_response_model = api.model('HeartbeatResponse', {
 
 def require_admin():
     """Verify current user is admin."""
-    current_user_id = get_jwt_identity()
-    employee = Employee.query.get(current_user_id)
+    current_user_id = current_employee_id()
+    employee = db.session.get(Employee, current_user_id)
 
     if not employee:
         return {'error': 'NOT_FOUND', 'message': 'User not found'}, 404
@@ -108,6 +111,6 @@ class Heartbeat(Resource):
     )
     def post(self):
         """Record user heartbeat to update last_seen timestamp."""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_employee_id()
         update_last_seen(current_user_id)
         return {'success': True}
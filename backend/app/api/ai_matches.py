@@ -6,11 +6,16 @@ Endpoints for passengers to view and interact with AI-detected ride matches.
 
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 import logging
+import traceback
 
+from app.api import current_employee_id
+from app.extensions import db
 from app.repositories.ai_match_repository import AIMatchRepository
 from app.services.ai_notification_service import AINotificationService
+from app.services.osrm_route_service import OSRMRouteService
+from app.models import Reservation, Ride
 from app.models.ai_match import AIMatch
 from app.models.passenger_request import PassengerRequest
 
@@ -57,7 +62,7 @@ class AIMatchList(Resource):
         - Ordered by match score (highest first)
         """
         try:
-            current_user_id = get_jwt_identity()
+            current_user_id = current_employee_id()
             
             # Get all passenger requests for this user
             passenger_requests = PassengerRequest.query.filter_by(
@@ -128,7 +133,7 @@ class AIMatchDetail(Resource):
         Verifies the match belongs to the current user (passenger or driver).
         """
         try:
-            current_user_id = get_jwt_identity()
+            current_user_id = current_employee_id()
             
             # Get the match
             match = AIMatchRepository.get_match_by_id(match_id)
@@ -140,10 +145,9 @@ class AIMatchDetail(Resource):
             
             # Verify this match belongs to the current user
             # User can be either the passenger or the driver
-            passenger_request = PassengerRequest.query.get(match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, match.passenger_request_id)
             
-            from app.models import Ride
-            ride = Ride.query.get(match.ride_id)
+            ride = db.session.get(Ride, match.ride_id)
             
             is_passenger = passenger_request and passenger_request.user_id == current_user_id
             is_driver = ride and ride.driver_id == current_user_id
@@ -198,7 +202,7 @@ class AIMatchRequest(Resource):
         Updates match status from 'suggested' to 'requested'.
         """
         try:
-            current_user_id = get_jwt_identity()
+            current_user_id = current_employee_id()
             
             # Get the match
             match = AIMatchRepository.get_match_by_id(match_id)
@@ -209,7 +213,7 @@ class AIMatchRequest(Resource):
                 }, 404
             
             # Verify this match belongs to the current user
-            passenger_request = PassengerRequest.query.get(match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, match.passenger_request_id)
             if not passenger_request or passenger_request.user_id != current_user_id:
                 return {
                     'error': 'FORBIDDEN',
@@ -279,7 +283,7 @@ class AIMatchReject(Resource):
         Updates match status from 'suggested' to 'rejected'.
         """
         try:
-            current_user_id = get_jwt_identity()
+            current_user_id = current_employee_id()
             
             # Get the match
             match = AIMatchRepository.get_match_by_id(match_id)
@@ -290,7 +294,7 @@ class AIMatchReject(Resource):
                 }, 404
             
             # Verify this match belongs to the current user
-            passenger_request = PassengerRequest.query.get(match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, match.passenger_request_id)
             if not passenger_request or passenger_request.user_id != current_user_id:
                 return {
                     'error': 'FORBIDDEN',
@@ -356,10 +360,7 @@ class AIMatchAccept(Resource):
         Only the ride driver can accept the request.
         """
         try:
-            from app.models import Ride, Reservation
-            from app import db
-            
-            current_user_id = get_jwt_identity()
+            current_user_id = current_employee_id()
             
             # Get the match
             match = AIMatchRepository.get_match_by_id(match_id)
@@ -370,7 +371,7 @@ class AIMatchAccept(Resource):
                 }, 404
             
             # Get the ride to verify driver
-            ride = Ride.query.get(match.ride_id)
+            ride = db.session.get(Ride, match.ride_id)
             if not ride:
                 return {
                     'error': 'NOT_FOUND',
@@ -385,7 +386,7 @@ class AIMatchAccept(Resource):
                 }, 403
             
             # Get passenger request to get passenger user_id
-            passenger_request = PassengerRequest.query.get(match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, match.passenger_request_id)
             if not passenger_request:
                 return {
                     'error': 'NOT_FOUND',
@@ -436,8 +437,6 @@ class AIMatchAccept(Resource):
             
             # Recalculate OSRM route with dynamic pickup
             try:
-                from app.services.osrm_route_service import OSRMRouteService
-                
                 if ride.origin_lat and ride.origin_lng and ride.destination_lat and ride.destination_lng:
                     new_route = OSRMRouteService.recalculate_route_with_pickup(
                         origin=(ride.origin_lat, ride.origin_lng),
@@ -481,7 +480,6 @@ class AIMatchAccept(Resource):
             
         except Exception as e:
             logger.error(f"Error accepting AI match {match_id}: {e}")
-            import traceback
             traceback.print_exc()
             db.session.rollback()
             return {
@@ -511,9 +509,7 @@ class AIMatchDecline(Resource):
         Only the ride driver can decline the request.
         """
         try:
-            from app.models import Ride
-            
-            current_user_id = get_jwt_identity()
+            current_user_id = current_employee_id()
             
             # Get the match
             match = AIMatchRepository.get_match_by_id(match_id)
@@ -524,7 +520,7 @@ class AIMatchDecline(Resource):
                 }, 404
             
             # Get the ride to verify driver
-            ride = Ride.query.get(match.ride_id)
+            ride = db.session.get(Ride, match.ride_id)
             if not ride:
                 return {
                     'error': 'NOT_FOUND',
@@ -1,14 +1,100 @@
-from flask import request
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+import secrets
 
-from app.extensions import db
-from app.models import Employee
+from flask import current_app, request
+from flask_restx import Namespace, Resource, fields
+from flask_jwt_extended import create_access_token, jwt_required
+from sqlalchemy import exists, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import undefer_group
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.api import current_employee_id
+from app.extensions import db, cache
+from app.models import Employee, Reservation, Ride
 from app.models.system_event import log_system_event
+from app.utils.cache import RIDE_LIST_VERSION_KEY
 from app.utils.logger import log_action
 
 api = Namespace('auth', description='Authentication operations')
 
+# Per-employee cache of the profile read by the /me endpoints, including the
+# ride and booking counts
+EMPLOYEE_PROFILE_CACHE_TTL = 60  # seconds
+
+
+def employee_profile_cache_key(employee_id):
+    return f'employee_profile:{employee_id}'
+
+
+# Profile fields live on the employee row; the counts change with their rides
+# and reservations
+cache.invalidate_on((Employee,), lambda e: employee_profile_cache_key(e.id))
+cache.invalidate_on((Ride,), lambda r: employee_profile_cache_key(r.driver_id))
+cache.invalidate_on((Reservation,), lambda r: employee_profile_cache_key(r.employee_id))
+
+
+def get_employee_profile(employee_id):
+    """Return employee_id's to_dict(include_stats=True), or None if missing."""
+    profile = cache.get(employee_profile_cache_key(employee_id))
+    if profile is not None:
+        return profile
+
+    employee = db.session.get(Employee, employee_id, options=[undefer_group('stats')])
+    if employee is None:
+        return None
+    profile = employee.to_dict(include_stats=True)
+    cache.set(employee_profile_cache_key(employee_id), profile, EMPLOYEE_PROFILE_CACHE_TTL)
+    return profile
+
+
+# Profile fields employees may edit themselves
+PROFILE_FIELDS = frozenset({'phone_number', 'car_model', 'car_plate', 'car_color'})
+
+
+def update_employee_profile(employee_id, data):
+    """Apply the PROFILE_FIELDS present in data with a single UPDATE.
+
+    Returns the refreshed profile, or None if the employee does not exist.
+    """
+    values = {field: data[field] for field in PROFILE_FIELDS if field in data}
+    if values:
+        updated = db.session.execute(
+            update(Employee).where(Employee.id == employee_id).values(**values)
+        ).rowcount
+        db.session.commit()
+        # Bulk statements bypass the mapper events used for invalidation
+        cache.delete(employee_profile_cache_key(employee_id), RIDE_LIST_VERSION_KEY)
+        if not updated:
+            return None
+    return get_employee_profile(employee_id)
+
+
+# Throwaway hash per PASSWORD_HASH_METHOD, checked when a login email is unknown
+_dummy_password_hashes = {}
+
+
+def _verify_dummy_password(password):
+    method = current_app.config['PASSWORD_HASH_METHOD']
+    dummy_hash = _dummy_password_hashes.get(method)
+    if dummy_hash is None:
+        dummy_hash = _dummy_password_hashes[method] = generate_password_hash(secrets.token_hex(), method=method)
+    check_password_hash(dummy_hash, password)
+
+
+def create_employee_token(employee):
+    """Issue an access token for employee with the profile claims the client reads."""
+    return create_access_token(
+        identity=str(employee.id),
+        additional_claims={
+            'email': employee.email,
+            'name': employee.name,
+            'department': employee.department,
+            'role': employee.role,
+            'status': employee.status,
+        }
+    )
+
+
 # Swagger models
 register_request = api.model('RegisterRequest', {
     'name': fields.String(required=True, description='Employee name'),
@@ -88,9 +174,8 @@ class Register(Resource):
         if not data.get('name') or not data.get('email') or not data.get('password') or not data.get('department'):
             api.abort(400, 'name, email, password, and department are required')
 
-        # Check if email already exists
-        existing = Employee.query.filter_by(email=data['email']).first()
-        if existing:
+        # Check if email already exists (answered from the unique email index)
+        if db.session.scalar(select(exists().where(Employee.email == data['email']))):
             api.abort(409, 'Email already registered')
 
         # Create new employee
@@ -102,7 +187,12 @@ class Register(Resource):
         employee.set_password(data['password'])
 
         db.session.add(employee)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Unique email constraint caught a concurrent registration
+            db.session.rollback()
+            api.abort(409, 'Email already registered')
 
         return employee, 201
 
@@ -121,8 +211,12 @@ class Login(Resource):
         if not email or not password:
             api.abort(400, 'email and password are required')
 
-        employee = Employee.query.filter_by(email=email).first()
+        employee = db.session.scalars(select(Employee).where(Employee.email == email)).first()
 
+        if employee is None:
+            # Same hashing cost as a wrong password, so unknown emails are not
+            # distinguishable by response time
+            _verify_dummy_password(password)
         if not employee or not employee.check_password(password):
             api.abort(
                 401,
@@ -136,16 +230,11 @@ class Login(Resource):
                 'message': 'Your account has been suspended. Please contact IT support.',
             }, 403
 
-        access_token = create_access_token(
-            identity=str(employee.id),
-            additional_claims={
-                'email': employee.email,
-                'name': employee.name,
-                'department': employee.department,
-                'role': employee.role,
-                'status': employee.status,
-            }
-        )
+        # Upgrade hashes created with an older method while the password is known
+        if employee.password_needs_rehash():
+            employee.set_password(password)
+
+        access_token = create_employee_token(employee)
 
         # Log system event for user login
         log_system_event(
@@ -179,8 +268,7 @@ class Me(Resource):
     @api.marshal_with(me_response)
     def get(self):
         """Get current authenticated employee"""
-        employee_id = int(get_jwt_identity())
-        employee = Employee.query.get(employee_id)
+        employee = get_employee_profile(current_employee_id())
 
         if not employee:
             api.abort(404, 'Employee not found')
@@ -196,8 +284,8 @@ class ChangePassword(Resource):
     @api.marshal_with(change_password_response)
     def post(self):
         """Change current employee's password"""
-        employee_id = int(get_jwt_identity())
-        employee = Employee.query.get(employee_id)
+        employee_id = current_employee_id()
+        employee = db.session.get(Employee, employee_id)
 
         if not employee:
             api.abort(404, 'Employee not found')
@@ -234,18 +322,11 @@ class DevToken(Resource):
         if not employee_id:
             api.abort(400, 'employee_id is required')
 
-        employee = Employee.query.get(employee_id)
+        employee = db.session.get(Employee, employee_id)
         if not employee:
             api.abort(404, 'Employee not found')
 
-        access_token = create_access_token(
-            identity=str(employee.id),
-            additional_claims={
-                'email': employee.email,
-                'name': employee.name,
-                'department': employee.department
-            }
-        )
+        access_token = create_employee_token(employee)
 
         return {
             'access_token': access_token,
@@ -1,12 +1,46 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from sqlalchemy import select, exists, literal, union_all, desc
+from sqlalchemy.exc import IntegrityError
 
+from app.api import current_employee_id
+from app.api.auth import get_employee_profile, update_employee_profile
 from app.extensions import db
 from app.models import Employee, Ride, Reservation
+from app.utils.pagination import get_page_args, paginate
+from app.utils.sql import iso_timestamp
 
 api = Namespace('employees', description='Employee operations')
 
+# Optional pagination query parameters shared by list endpoints
+page_params = {
+    'page': {'description': 'Page number (enables pagination)', 'type': 'integer', 'required': False},
+    'per_page': {'description': 'Items per page (default: 20, max: 100)', 'type': 'integer', 'required': False}
+}
+
+# The activity timeline grows without bound, so unpaginated requests only
+# return the most recent items
+HISTORY_DEFAULT_LIMIT = 100
+
+# Columns returned by the list endpoints, already in response shape: rows are
+# serialized as-is (no marshalling), so timestamps are formatted in SQL
+EMPLOYEE_LIST_COLUMNS = (
+    Employee.id, Employee.name, Employee.email, Employee.department,
+    iso_timestamp(Employee.created_at).label('created_at')
+)
+RIDE_LIST_COLUMNS = (
+    Ride.id, Ride.driver_id, Ride.origin, Ride.destination,
+    iso_timestamp(Ride.departure_time).label('departure_time'),
+    Ride.available_seats, Ride.status,
+    iso_timestamp(Ride.created_at).label('created_at')
+)
+RESERVATION_LIST_COLUMNS = (
+    Reservation.id, Reservation.employee_id, Reservation.ride_id,
+    Reservation.seats_reserved, Reservation.status,
+    iso_timestamp(Reservation.created_at).label('created_at')
+)
+
 # Error response model
 error_response = api.model('ErrorResponse', {
     'error': fields.String(description='Error code (e.g., VALIDATION_ERROR, NOT_FOUND, UNAUTHORIZED, FORBIDDEN, INTERNAL_ERROR)'),
@@ -51,16 +85,17 @@ reservation_response = api.model('ReservationResponse', {
 
 @api.route('/')
 class EmployeeList(Resource):
-    @api.doc('list_employees',
+    @api.doc('list_employees', params=page_params,
         responses={
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_list_with(employee_response)
+    @api.response(200, 'Success', [employee_response])
     def get(self):
         """List all employees"""
-        employees = Employee.query.all()
-        return employees
+        stmt = select(*EMPLOYEE_LIST_COLUMNS).order_by(Employee.id)
+        rows = db.session.execute(paginate(stmt, get_page_args())).mappings()
+        return [dict(row) for row in rows]
 
     @api.doc('create_employee',
         responses={
@@ -73,7 +108,7 @@ class EmployeeList(Resource):
     def post(self):
         """Create a new employee"""
         data = request.get_json() or {}
-        if Employee.query.filter_by(email=data.get('email')).first():
+        if db.session.scalar(select(exists().where(Employee.email == data.get('email')))):
             api.abort(400, 'Email already exists')
         employee = Employee(
             name=data['name'],
@@ -81,7 +116,12 @@ class EmployeeList(Resource):
             department=data['department']
         )
         db.session.add(employee)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Unique email constraint caught a concurrent insert
+            db.session.rollback()
+            api.abort(400, 'Email already exists')
         return employee, 201
 
 
@@ -89,34 +129,39 @@ class EmployeeList(Resource):
 class MyRides(Resource):
     @jwt_required()
     @api.doc('my_rides', security='Bearer', description='Get all rides where the current employee is the driver',
+        params=page_params,
         responses={
             401: ('Unauthorized - JWT required', error_response),
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_list_with(ride_response)
+    @api.response(200, 'Success', [ride_response])
     def get(self):
         """Get all rides where the current employee is the driver"""
-        employee_id = int(get_jwt_identity())
-        rides = Ride.query.filter_by(driver_id=employee_id).all()
-        return rides
+        employee_id = current_employee_id()
+        stmt = select(*RIDE_LIST_COLUMNS).where(Ride.driver_id == employee_id).order_by(Ride.id)
+        rows = db.session.execute(paginate(stmt, get_page_args())).mappings()
+        return [dict(row) for row in rows]
 
 
 @api.route('/me/reservations')
 class MyReservations(Resource):
     @jwt_required()
     @api.doc('my_reservations', security='Bearer', description='Get all reservations made by the current employee',
+        params=page_params,
         responses={
             401: ('Unauthorized - JWT required', error_response),
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_list_with(reservation_response)
+    @api.response(200, 'Success', [reservation_response])
     def get(self):
         """Get all reservations made by the current employee"""
-        employee_id = int(get_jwt_identity())
-        reservations = Reservation.query.filter_by(employee_id=employee_id).all()
-        return reservations
+        employee_id = current_employee_id()
+        stmt = select(*RESERVATION_LIST_COLUMNS) \
+            .where(Reservation.employee_id == employee_id).order_by(Reservation.id)
+        rows = db.session.execute(paginate(stmt, get_page_args())).mappings()
+        return [dict(row) for row in rows]
 
 
 # Profile update model
@@ -146,7 +191,7 @@ history_item = api.model('HistoryItem', {
     'ride_id': fields.Integer(description='Ride ID'),
     'origin': fields.String(description='Pickup location'),
     'destination': fields.String(description='Drop-off location'),
-    'departure_time': fields.DateTime(description='Departure datetime'),
+    'departure_time': fields.String(description='Departure datetime (ISO)'),
     'status': fields.String(description='Ride status')
 })
 
@@ -154,54 +199,49 @@ history_item = api.model('HistoryItem', {
 @api.route('/me/history')
 class MyHistory(Resource):
     @jwt_required()
-    @api.doc('my_history', security='Bearer', description='Get combined timeline of rides driven and reservations made',
+    @api.doc('my_history', security='Bearer', description=f'Get combined timeline of rides driven and reservations made (latest {HISTORY_DEFAULT_LIMIT} unless paginated)',
+        params=page_params,
         responses={
             401: ('Unauthorized - JWT required', error_response),
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_list_with(history_item)
+    @api.response(200, 'Success', [history_item])
     def get(self):
         """Get combined timeline of employee activity (rides driven + reservations made)"""
-        employee_id = int(get_jwt_identity())
-        
-        # Get rides where employee is driver
-        rides_driven = Ride.query.filter_by(driver_id=employee_id).all()
-        
-        # Get reservations made by employee (join with Ride to get details)
-        reservations = Reservation.query.filter_by(employee_id=employee_id).all()
+        employee_id = current_employee_id()
         
-        # Build history items
-        history = []
+        # Rides where employee is driver
+        rides_driven = select(
+            literal('DRIVER_RIDE').label('type'),
+            Ride.id.label('ride_id'),
+            Ride.origin,
+            Ride.destination,
+            iso_timestamp(Ride.departure_time).label('departure_time'),
+            Ride.status
+        ).where(Ride.driver_id == employee_id)
         
-        # Add rides driven
-        for ride in rides_driven:
-            history.append({
-                'type': 'DRIVER_RIDE',
-                'ride_id': ride.id,
-                'origin': ride.origin,
-                'destination': ride.destination,
-                'departure_time': ride.departure_time.isoformat() if ride.departure_time else None,
-                'status': ride.status
-            })
+        # Reservations made by employee, joined with the reserved ride
+        reservations = select(
+            literal('RESERVATION').label('type'),
+            Ride.id.label('ride_id'),
+            Ride.origin,
+            Ride.destination,
+            iso_timestamp(Ride.departure_time).label('departure_time'),
+            Ride.status
+        ).select_from(Reservation).join(
+            Ride, Reservation.ride_id == Ride.id
+        ).where(Reservation.employee_id == employee_id)
         
-        # Add reservations (get ride details for each)
-        for reservation in reservations:
-            ride = Ride.query.get(reservation.ride_id)
-            if ride:
-                history.append({
-                    'type': 'RESERVATION',
-                    'ride_id': ride.id,
-                    'origin': ride.origin,
-                    'destination': ride.destination,
-                    'departure_time': ride.departure_time.isoformat() if ride.departure_time else None,
-                    'status': ride.status
-                })
-        
-        # Sort by departure_time (newest first)
-        history.sort(key=lambda x: x['departure_time'] if x['departure_time'] else '', reverse=True)
-        
-        return history
+        # Single round-trip, sorted by departure_time (newest first) in SQL;
+        # ISO strings sort chronologically and are returned as-is. The
+        # type/ride_id tie-breakers keep pages stable.
+        stmt = union_all(rides_driven, reservations) \
+            .order_by(desc('departure_time'), desc('type'), desc('ride_id'))
+        page_args = get_page_args() or (1, HISTORY_DEFAULT_LIMIT)
+        # Rows are already in response shape; skip marshalling
+        rows = db.session.execute(paginate(stmt, page_args)).mappings()
+        return [dict(row) for row in rows]
 
 
 @api.route('/me')
@@ -217,14 +257,12 @@ class UserProfile(Resource):
     @api.marshal_with(employee_profile_response)
     def get(self):
         """Get current user profile with carpool stats"""
-        employee_id = int(get_jwt_identity())
-        employee = Employee.query.get(employee_id)
+        profile = get_employee_profile(current_employee_id())
         
-        if not employee:
+        if not profile:
             api.abort(404, 'User not found')
         
-        # Return employee dict with stats
-        return employee.to_dict(include_stats=True)
+        return profile
 
     @jwt_required()
     @api.doc('update_user_profile', security='Bearer', description='Update current user profile',
@@ -239,25 +277,13 @@ class UserProfile(Resource):
     @api.marshal_with(employee_profile_response)
     def patch(self):
         """Update current user profile (phone, car details)"""
-        employee_id = int(get_jwt_identity())
-        employee = Employee.query.get(employee_id)
-        
-        if not employee:
-            api.abort(404, 'User not found')
-        
         data = request.get_json() or {}
         
-        # Update allowed fields
-        if 'phone_number' in data:
-            employee.phone_number = data['phone_number']
-        if 'car_model' in data:
-            employee.car_model = data['car_model']
-        if 'car_plate' in data:
-            employee.car_plate = data['car_plate']
-        if 'car_color' in data:
-            employee.car_color = data['car_color']
+        # Only the allowed profile fields are written
+        profile = update_employee_profile(current_employee_id(), data)
         
-        db.session.commit()
+        if not profile:
+            api.abort(404, 'User not found')
         
         # Return updated profile with stats
-        return employee.to_dict(include_stats=True)
+        return profile
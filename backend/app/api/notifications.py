@@ -1,12 +1,38 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from sqlalchemy import delete, exists, select, update, or_, and_
 
-from app.extensions import db
+from app.api import current_employee_id
+from app.extensions import db, cache
 from app.models import Notification
+from app.utils.pagination import MAX_PER_PAGE
+from app.utils.sql import iso_timestamp
 
 api = Namespace('notifications', description='Notification operations')
 
+# Per-employee cache of the default (unpaginated) notification list
+NOTIFICATION_LIST_CACHE_TTL = 60
+
+
+def notification_list_cache_key(employee_id):
+    return f'notif:{employee_id}'
+
+
+# Any committed insert/update/delete of a notification drops its owner's list
+cache.invalidate_on((Notification,), lambda n: notification_list_cache_key(n.employee_id))
+
+
+def _abort_not_owned(notification_id, forbidden_message):
+    """Abort after an owner-scoped statement matched no row.
+
+    Returns 403 when the notification belongs to someone else, 404 otherwise.
+    """
+    if db.session.scalar(select(exists().where(Notification.id == notification_id))):
+        api.abort(403, forbidden_message)
+    api.abort(404, 'Notification not found')
+
+
 # Error response model
 error_response = api.model('ErrorResponse', {
     'error': fields.String(description='Error code (e.g., VALIDATION_ERROR, NOT_FOUND, UNAUTHORIZED, FORBIDDEN, INTERNAL_ERROR)'),
@@ -42,17 +68,57 @@ notification_read_response = api.model('NotificationReadResponse', {
 class NotificationList(Resource):
     @jwt_required()
     @api.doc('list_notifications', security='Bearer', description='Get all notifications for current user (newest first)',
+        params={
+            'limit': {'description': f'Maximum number of notifications to return (max: {MAX_PER_PAGE})', 'type': 'integer', 'required': False},
+            'before_id': {'description': 'Return notifications older than this notification ID (keyset cursor)', 'type': 'integer', 'required': False}
+        },
         responses={
             401: ('Unauthorized - JWT required', error_response),
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_list_with(notification_response)
+    @api.response(200, 'Success', [notification_response])
     def get(self):
         """Get all notifications for current user (newest first)"""
-        employee_id = int(get_jwt_identity())
-        notifications = Notification.query.filter_by(employee_id=employee_id) \
-            .order_by(Notification.created_at.desc()).all()
+        employee_id = current_employee_id()
+        
+        limit = request.args.get('limit', type=int)
+        before_id = request.args.get('before_id', type=int)
+        
+        # Only the full list polled by the notification panel is cached
+        cacheable = limit is None and before_id is None
+        if cacheable:
+            cached = cache.get(notification_list_cache_key(employee_id))
+            if cached is not None:
+                return cached
+        
+        stmt = select(
+            Notification.id,
+            Notification.employee_id,
+            Notification.ride_id,
+            Notification.message,
+            Notification.type,
+            Notification.is_read,
+            iso_timestamp(Notification.created_at).label('created_at')
+        ).where(Notification.employee_id == employee_id) \
+            .order_by(Notification.created_at.desc(), Notification.id.desc())
+        
+        # Keyset pagination: continue after the (created_at, id) of the cursor row
+        if before_id is not None:
+            cursor = select(Notification.created_at).where(Notification.id == before_id).scalar_subquery()
+            stmt = stmt.where(or_(
+                Notification.created_at < cursor,
+                and_(Notification.created_at == cursor, Notification.id < before_id)
+            ))
+        if limit is not None:
+            if limit < 1 or limit > MAX_PER_PAGE:
+                api.abort(400, f'limit must be between 1 and {MAX_PER_PAGE}')
+            stmt = stmt.limit(limit)
+        
+        # Rows are already in response shape; skip marshalling
+        notifications = [dict(row) for row in db.session.execute(stmt).mappings()]
+        if cacheable:
+            cache.set(notification_list_cache_key(employee_id), notifications, NOTIFICATION_LIST_CACHE_TTL)
         return notifications
 
     @jwt_required()
@@ -101,11 +167,13 @@ class NotificationMarkAllRead(Resource):
     )
     def post(self):
         """Mark all notifications as read for current user"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
         # Update all unread notifications for this employee
         Notification.query.filter_by(employee_id=employee_id, is_read=False).update({'is_read': True})
         db.session.commit()
+        # Bulk statements bypass the mapper events used for invalidation
+        cache.delete(notification_list_cache_key(employee_id))
         
         return {'message': 'All notifications marked as read'}, 200
 
@@ -121,10 +189,12 @@ class NotificationClearAll(Resource):
     )
     def delete(self):
         """Delete all notifications for current user"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
 
         Notification.query.filter_by(employee_id=employee_id).delete()
         db.session.commit()
+        # Bulk statements bypass the mapper events used for invalidation
+        cache.delete(notification_list_cache_key(employee_id))
 
         return {'message': 'All notifications cleared'}, 200
 
@@ -144,18 +214,23 @@ class NotificationRead(Resource):
     @api.marshal_with(notification_read_response)
     def patch(self, notification_id):
         """Mark a notification as read"""
-        employee_id = int(get_jwt_identity())
-        notification = Notification.query.get(notification_id)
+        employee_id = current_employee_id()
         
-        if not notification:
-            api.abort(404, 'Notification not found')
+        # Ownership check and update in one statement; only the owner can
+        # mark their notification as read
+        notification = db.session.execute(
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.employee_id == employee_id)
+            .values(is_read=True)
+            .returning(Notification.id, Notification.message, Notification.type, Notification.is_read)
+        ).mappings().first()
         
-        # Only the owner can mark their notification as read
-        if notification.employee_id != employee_id:
-            api.abort(403, 'Not authorized to access this notification')
+        if notification is None:
+            _abort_not_owned(notification_id, 'Not authorized to access this notification')
         
-        notification.is_read = True
         db.session.commit()
+        # Bulk statements bypass the mapper events used for invalidation
+        cache.delete(notification_list_cache_key(employee_id))
         return notification
 
 
@@ -173,16 +248,17 @@ class NotificationDetail(Resource):
     )
     def delete(self, notification_id):
         """Delete a notification by ID"""
-        employee_id = int(get_jwt_identity())
-        notification = Notification.query.get(notification_id)
-        
-        if not notification:
-            api.abort(404, 'Notification not found')
+        employee_id = current_employee_id()
         
         # Only the owner can delete their notification
-        if notification.employee_id != employee_id:
-            api.abort(403, 'Not authorized to delete this notification')
+        deleted = db.session.execute(
+            delete(Notification)
+            .where(Notification.id == notification_id, Notification.employee_id == employee_id)
+        ).rowcount
+        
+        if not deleted:
+            _abort_not_owned(notification_id, 'Not authorized to delete this notification')
         
-        db.session.delete(notification)
         db.session.commit()
+        cache.delete(notification_list_cache_key(employee_id))
         return {'message': 'Notification deleted successfully'}, 200
@@ -1,13 +1,22 @@
-from flask import request
+from flask import Response, request, stream_with_context
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from werkzeug.exceptions import HTTPException
+from flask_jwt_extended import jwt_required
 from datetime import datetime
+from sqlalchemy import select, update, case, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, load_only, defer
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.extensions import db, socketio
+from app.api import current_employee_id
+from app.extensions import db, socketio, cache
 from app.models import Reservation, Ride, Employee, Notification
 from app.models.system_event import log_system_event
+from app.utils.cache import RIDE_LIST_VERSION_KEY
+from app.utils.concurrency import retry_on_conflict
 from app.utils.logger import log_action
+from app.utils.pagination import get_page_args, paginate
+from app.utils.serialization import stream_json_array
+from app.utils.sql import iso_timestamp
 from app.realtime_events import emit_ride_status_update
 from app.services.boarding_service import confirm_boarding, check_and_expire_boarding_deadlines
 from app.services.ride_auto_termination_service import check_and_terminate_rides
@@ -63,13 +72,81 @@ reservation_with_ride_response = api.model('ReservationWithRideResponse', {
     'ride': fields.Nested(ride_info, description='Ride details')
 })
 
+# Notification message templates, filled in only once a request has passed validation
+RESERVATION_REQUEST_MESSAGE = 'New Request: {passenger} wants to join your ride to {destination}.'
+RESERVATION_APPROVED_MESSAGE = 'Ride Approved! Your trip to {destination} is confirmed.'
+TRIP_CANCELLED_MESSAGE = 'Trip Cancelled: Your ride to {destination} was cancelled.'
+
+
+def short_destination(ride):
+    """First part of the ride destination (e.g. the city), for notification text."""
+    return (ride.destination or '').split(',')[0].strip() or ride.destination
+
+
+
+def _is_duplicate_active_reservation(error):
+    """Whether an IntegrityError was raised by uq_reservations_active."""
+    diag = getattr(error.orig, 'diag', None)
+    if diag is not None:
+        return diag.constraint_name == 'uq_reservations_active'
+    # SQLite reports the index columns rather than the index name
+    return 'UNIQUE constraint failed: reservations.employee_id, reservations.ride_id' in str(error.orig)
+
+# Rows fetched and encoded per chunk when a list is streamed
+STREAM_BATCH_SIZE = 500
+
+# Columns returned by the basic reservation list, in response order
+RESERVATION_LIST_COLUMNS = (
+    Reservation.id,
+    Reservation.employee_id,
+    Reservation.ride_id,
+    Reservation.seats_reserved,
+    Reservation.status,
+    iso_timestamp(Reservation.created_at).label('created_at')
+)
+
+
+# Ride, MISSED-reservation flag and passenger name for a booking request. Built
+# once at import; only the bound ride_id/employee_id change per request.
+BOOKING_PREREQUISITES = select(
+    Ride,
+    select(Reservation.id).where(
+        Reservation.employee_id == bindparam('employee_id'),
+        Reservation.ride_id == Ride.id,
+        Reservation.status == 'MISSED'
+    ).exists().label('missed'),
+    select(Employee.name).where(Employee.id == bindparam('employee_id')).scalar_subquery().label('passenger_name')
+).where(Ride.id == bindparam('ride_id'))
+
+
+def get_reservation_with_ride(reservation_id):
+    """Load a reservation and its ride in a single joined SELECT.
+
+    Only the columns the reservation actions read are fetched; the ride's
+    coordinates and route polyline are left out.
+    """
+    return db.session.get(Reservation, reservation_id, options=[
+        load_only(
+            Reservation.id, Reservation.employee_id, Reservation.ride_id,
+            Reservation.seats_reserved, Reservation.status, Reservation.created_at
+        ),
+        joinedload(Reservation.ride).load_only(
+            Ride.id, Ride.driver_id, Ride.origin, Ride.destination,
+            Ride.available_seats, Ride.status, Ride.is_deleted, Ride.version
+        )
+    ])
+
+
 @api.route('/')
 class ReservationList(Resource):
     @jwt_required()
     @api.doc('list_reservations', security='Bearer',
         params={
             'employee_id': {'description': 'Filter by employee ID (for getting my bookings)', 'type': 'integer', 'required': False},
-            'include_ride': {'description': 'Include ride details in response', 'type': 'boolean', 'required': False, 'default': False}
+            'include_ride': {'description': 'Include ride details in response', 'type': 'boolean', 'required': False, 'default': False},
+            'page': {'description': 'Page number (enables pagination)', 'type': 'integer', 'required': False},
+            'per_page': {'description': 'Items per page (default: 20, max: 100)', 'type': 'integer', 'required': False},
+            'stream': {'description': 'Stream the list in batches (ignored with include_ride)', 'type': 'boolean', 'required': False, 'default': False}
         },
         responses={
             401: ('Unauthorized - JWT required', error_response),
@@ -82,32 +159,46 @@ class ReservationList(Resource):
         check_and_expire_boarding_deadlines()
         check_and_terminate_rides()
         
-        query = Reservation.query
+        criteria = []
 
         # Employee filter (for getting my bookings)
         employee_id = request.args.get('employee_id')
         if employee_id:
             try:
-                query = query.filter(Reservation.employee_id == int(employee_id))
+                criteria.append(Reservation.employee_id == int(employee_id))
             except ValueError:
                 api.abort(400, 'employee_id must be an integer')
 
-        reservations = query.all()
+        page_args = get_page_args()
         
         # Check if ride details should be included
         include_ride = request.args.get('include_ride', 'false').lower() == 'true'
-        log_action('GET_RESERVATIONS', f'include_ride={include_ride}, count={len(reservations)}')
         
         if include_ride:
+            # Only the serialized columns, with ride and driver joined in the same
+            # SELECT (the ride's route polyline is never returned here)
+            stmt = select(Reservation).options(
+                load_only(
+                    Reservation.id, Reservation.employee_id, Reservation.ride_id, Reservation.seats_reserved,
+                    Reservation.status, Reservation.boarding_deadline, Reservation.boarded, Reservation.created_at
+                ),
+                joinedload(Reservation.ride).options(
+                    defer(Ride.route_polyline),
+                    joinedload(Ride.driver).load_only(Employee.id, Employee.name, Employee.email)
+                )
+            ).where(*criteria).order_by(Reservation.id)
+            reservations = db.session.scalars(paginate(stmt, page_args)).all()
+            log_action('GET_RESERVATIONS', f'include_ride={include_ride}, count={len(reservations)}')
+
             # Return reservations with ride details
             result = []
             for reservation in reservations:
-                ride = Ride.query.get(reservation.ride_id)
+                ride = reservation.ride
                 # Skip if ride is deleted or doesn't exist
                 if not ride or ride.is_deleted:
                     continue
                     
-                driver = Employee.query.get(ride.driver_id) if ride else None
+                driver = ride.driver
                 
                 reservation_data = {
                     'id': reservation.id,
@@ -144,15 +235,22 @@ class ReservationList(Resource):
             log_action('GET_RESERVATIONS_RESULT', f'Returning {len(result)} reservations with ride details')
             return result
         else:
-            # Return basic reservations without ride details
-            return [{
-                'id': r.id,
-                'employee_id': r.employee_id,
-                'ride_id': r.ride_id,
-                'seats_reserved': r.seats_reserved,
-                'status': r.status,
-                'created_at': r.created_at.isoformat() if r.created_at else None
-            } for r in reservations]
+            # Return basic reservations without ride details; rows are already
+            # in response shape (timestamps formatted in SQL)
+            stmt = select(*RESERVATION_LIST_COLUMNS).where(*criteria).order_by(Reservation.id)
+            if request.args.get('stream', 'false').lower() in ('1', 'true'):
+                # Server-side cursor read STREAM_BATCH_SIZE rows at a time
+                rows = db.session.execute(
+                    paginate(stmt, page_args).execution_options(yield_per=STREAM_BATCH_SIZE)
+                ).mappings()
+                log_action('GET_RESERVATIONS', f'include_ride={include_ride}, stream=True')
+                return Response(
+                    stream_with_context(stream_json_array((dict(row) for row in rows), STREAM_BATCH_SIZE)),
+                    mimetype='application/json'
+                )
+            reservations = [dict(row) for row in db.session.execute(paginate(stmt, page_args)).mappings()]
+            log_action('GET_RESERVATIONS', f'include_ride={include_ride}, count={len(reservations)}')
+            return reservations
 
     @jwt_required()
     @api.doc('create_reservation', security='Bearer', description='Request a seat on a ride. Creates PENDING reservation. Driver must approve.',
@@ -176,108 +274,96 @@ class ReservationList(Resource):
 
         ride_id = data.get('ride_id')
         # Get employee_id from JWT token instead of request body
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
         if not ride_id:
             api.abort(400, 'ride_id is required')
 
-        try:
-            ride = Ride.query.get(ride_id)
-            if not ride:
-                api.abort(404, 'Ride not found')
-
-            short_destination = (ride.destination or '').split(',')[0].strip() or ride.destination
-
-            # Prevent self-booking: users cannot book their own rides
-            if ride.driver_id == employee_id:
-                api.abort(400, 'You cannot book a seat on your own ride')
-
-            # Part 2: Freeze reservation intake - only allow bookings for scheduled rides
-            ride_status_lower = (ride.status or 'scheduled').lower()
-            if ride_status_lower not in ['scheduled', 'active', 'full']:
-                api.abort(400, f'Cannot book ride - ride is already {ride_status_lower}. Reservations are only accepted before the driver departs.')
-
-            # Check duplicate active reservation (PENDING or CONFIRMED)
-            existing_reservation = Reservation.query.filter_by(
-                employee_id=employee_id,
-                ride_id=ride_id
-            ).filter(Reservation.status.in_(['PENDING', 'CONFIRMED'])).first()
-            
-            if existing_reservation:
-                api.abort(400, 'You already have an active reservation for this ride')
-
-            # No re-request rule: MISSED reservations are terminal
-            missed_reservation = Reservation.query.filter_by(
-                employee_id=employee_id,
-                ride_id=ride_id,
-                status='MISSED'
-            ).first()
-            
-            if missed_reservation:
-                api.abort(400, 'You missed boarding for this ride. Cannot re-request.')
-
-            # Validate ride status
-            if ride.status == 'COMPLETED':
-                api.abort(400, 'Cannot book a completed ride')
-            
-            if ride.status == 'FULL':
-                api.abort(400, 'Ride is already full')
+        # One round-trip for the ride, the missed-boarding flag and the
+        # passenger's name (duplicates are rejected by uq_reservations_active)
+        row = db.session.execute(
+            BOOKING_PREREQUISITES, {'ride_id': ride_id, 'employee_id': employee_id}
+        ).first()
+        if row is None:
+            api.abort(404, 'Ride not found')
+        ride = row.Ride
+
+        # Prevent self-booking: users cannot book their own rides
+        if ride.driver_id == employee_id:
+            api.abort(400, 'You cannot book a seat on your own ride')
+
+        # Part 2: Freeze reservation intake - only allow bookings for scheduled rides
+        ride_status_lower = (ride.status or 'scheduled').lower()
+        if ride_status_lower not in ['scheduled', 'active', 'full']:
+            api.abort(400, f'Cannot book ride - ride is already {ride_status_lower}. Reservations are only accepted before the driver departs.')
+
+        # No re-request rule: MISSED reservations are terminal
+        if row.missed:
+            api.abort(400, 'You missed boarding for this ride. Cannot re-request.')
+
+        # Validate ride status
+        if ride.status == 'COMPLETED':
+            api.abort(400, 'Cannot book a completed ride')
+        
+        if ride.status == 'FULL':
+            api.abort(400, 'Ride is already full')
 
-            # Strict seat enforcement (check if seats would be available if approved)
-            if seats_reserved > ride.available_seats:
-                api.abort(400, f'Not enough seats available. Requested: {seats_reserved}, Available: {ride.available_seats}')
+        # Strict seat enforcement (check if seats would be available if approved)
+        if seats_reserved > ride.available_seats:
+            api.abort(400, f'Not enough seats available. Requested: {seats_reserved}, Available: {ride.available_seats}')
 
-            # Create reservation with PENDING status (no seat deduction yet)
-            reservation = Reservation(
-                employee_id=employee_id,
-                ride_id=ride.id,
-                seats_reserved=seats_reserved,
-                status='PENDING'
-            )
-            db.session.add(reservation)
-            db.session.flush()
+        passenger_name = row.passenger_name or f'Employee #{employee_id}'
 
-            passenger = Employee.query.get(employee_id)
-            passenger_name = passenger.name if passenger else f'Employee #{employee_id}'
+        # Create reservation with PENDING status (no seat deduction yet)
+        reservation = Reservation(
+            employee_id=employee_id,
+            ride_id=ride.id,
+            seats_reserved=seats_reserved,
+            status='PENDING'
+        )
 
-            # Create notification for the driver
-            driver_notification = Notification(
-                employee_id=ride.driver_id,
-                ride_id=ride.id,
-                message=f'New Request: {passenger_name} wants to join your ride to {short_destination}.',
-                type='request',
-                is_read=False
-            )
-            db.session.add(driver_notification)
-            
-            # Log system event for reservation requested
-            log_system_event(
-                event_type='RESERVATION_REQUESTED',
-                entity_type='reservation',
-                description=f'{passenger_name} requested {seats_reserved} seat(s) for ride #{ride.id}',
-                user_id=employee_id,
-                ride_id=ride.id,
-                reservation_id=reservation.id,
-                metadata={'seats_reserved': seats_reserved, 'status': 'PENDING'}
-            )
-            
+        # Create notification for the driver
+        driver_notification = Notification(
+            employee_id=ride.driver_id,
+            ride_id=ride.id,
+            message=RESERVATION_REQUEST_MESSAGE.format(passenger=passenger_name, destination=short_destination(ride)),
+            type='request',
+            is_read=False
+        )
+        db.session.add_all([reservation, driver_notification])
+        
+        # Log system event for reservation requested
+        event = log_system_event(
+            event_type='RESERVATION_REQUESTED',
+            entity_type='reservation',
+            description=f'{passenger_name} requested {seats_reserved} seat(s) for ride #{ride.id}',
+            user_id=employee_id,
+            ride_id=ride.id,
+            metadata={'seats_reserved': seats_reserved, 'status': 'PENDING'}
+        )
+        if event:
+            # Linked through the relationship so the reservation id is filled in
+            # by the single flush at commit instead of an explicit flush here
+            event.reservation = reservation
+        
+        # Duplicate active reservations are rejected by uq_reservations_active
+        # in the same INSERT, so concurrent requests cannot both succeed
+        try:
             db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            if not _is_duplicate_active_reservation(e):
+                raise
+            api.abort(400, 'You already have an active reservation for this ride')
 
-            # Log reservation creation (console)
-            log_action(
-                action='RESERVATION_CREATED',
-                employee_id=employee_id,
-                details={'reservation_id': reservation.id, 'ride_id': ride_id, 'seats_reserved': seats_reserved, 'status': 'PENDING'}
-            )
+        # Log reservation creation (console)
+        log_action(
+            action='RESERVATION_CREATED',
+            employee_id=employee_id,
+            details={'reservation_id': reservation.id, 'ride_id': ride_id, 'seats_reserved': seats_reserved, 'status': 'PENDING'}
+        )
 
-            return reservation, 201
-            
-        except HTTPException:
-            # Re-raise HTTP exceptions (400, 403, 404) without modification
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Booking request failed: {str(e)}')
+        return reservation, 201
 
 
 @api.route('/clear-completed')
@@ -291,44 +377,39 @@ class ClearCompletedReservations(Resource):
     )
     def delete(self):
         """Clear all completed reservations for the current user"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            # Get all reservations for this user
-            reservations = Reservation.query.filter_by(employee_id=employee_id).all()
-            
-            deleted_count = 0
-            for reservation in reservations:
-                reservation_status = (reservation.status or '').upper()
-                ride = Ride.query.get(reservation.ride_id)
-                ride_status = (ride.status or 'scheduled').lower() if ride else 'unknown'
-                
-                # Delete if cancelled/rejected/missed or from completed/cancelled/missed ride
-                can_delete = (
-                    reservation_status in ['CANCELLED', 'REJECTED', 'MISSED'] or
-                    ride_status in ['completed', 'cancelled', 'missed']
-                )
-                
-                if can_delete:
-                    db.session.delete(reservation)
-                    deleted_count += 1
-            
-            db.session.commit()
-            
-            log_action(
-                action='RESERVATIONS_CLEARED',
-                employee_id=employee_id,
-                details={'deleted_count': deleted_count}
+        # Get all reservations for this user
+        reservations = Reservation.query.filter_by(employee_id=employee_id).all()
+        
+        deleted_count = 0
+        for reservation in reservations:
+            reservation_status = (reservation.status or '').upper()
+            ride = db.session.get(Ride, reservation.ride_id)
+            ride_status = (ride.status or 'scheduled').lower() if ride else 'unknown'
+            
+            # Delete if cancelled/rejected/missed or from completed/cancelled/missed ride
+            can_delete = (
+                reservation_status in ['CANCELLED', 'REJECTED', 'MISSED'] or
+                ride_status in ['completed', 'cancelled', 'missed']
             )
             
-            return {
-                'message': f'Successfully deleted {deleted_count} completed reservation(s)',
-                'deleted_count': deleted_count
-            }, 200
-            
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Failed to clear reservations: {str(e)}')
+            if can_delete:
+                db.session.delete(reservation)
+                deleted_count += 1
+        
+        db.session.commit()
+        
+        log_action(
+            action='RESERVATIONS_CLEARED',
+            employee_id=employee_id,
+            details={'deleted_count': deleted_count}
+        )
+        
+        return {
+            'message': f'Successfully deleted {deleted_count} completed reservation(s)',
+            'deleted_count': deleted_count
+        }, 200
 
 
 @api.route('/<int:id>/cancel')
@@ -345,10 +426,11 @@ class ReservationCancel(Resource):
         }
     )
     @api.marshal_with(reservation_response)
+    @retry_on_conflict()
     def post(self, id):
         """Cancel a reservation (only the creator can cancel)"""
-        employee_id = int(get_jwt_identity())
-        reservation = Reservation.query.get(id)
+        employee_id = current_employee_id()
+        reservation = get_reservation_with_ride(id)
         
         if not reservation:
             api.abort(404, 'Reservation not found')
@@ -362,7 +444,7 @@ class ReservationCancel(Resource):
             api.abort(400, f'Reservation is already {reservation.status.lower()}')
         
         # Check ride status - passenger can cancel until ride is in_progress
-        ride = Ride.query.get(reservation.ride_id)
+        ride = reservation.ride
         if ride:
             ride_status = (ride.status or 'scheduled').lower()
             # Cannot cancel if ride is in_progress, completed, or cancelled
@@ -371,7 +453,6 @@ class ReservationCancel(Resource):
         
         # Restore available seats only if reservation was CONFIRMED
         if reservation.status == 'CONFIRMED':
-            ride = Ride.query.get(reservation.ride_id)
             if ride:
                 ride.available_seats += reservation.seats_reserved
                 # Mark ride as ACTIVE again if it was FULL
@@ -382,20 +463,18 @@ class ReservationCancel(Resource):
         reservation.status = 'CANCELLED'
         
         # Create notification for the driver about cancellation
-        ride = Ride.query.get(reservation.ride_id)
         if ride:
-            short_destination = (ride.destination or '').split(',')[0].strip() or ride.destination
             cancel_notification = Notification(
                 employee_id=ride.driver_id,
                 ride_id=ride.id,
-                message=f'Trip Cancelled: Your ride to {short_destination} was cancelled.',
+                message=TRIP_CANCELLED_MESSAGE.format(destination=short_destination(ride)),
                 type='cancellation',
                 is_read=False
             )
             db.session.add(cancel_notification)
         
         # Log system event for reservation cancellation
-        passenger = Employee.query.get(employee_id)
+        passenger = db.session.get(Employee, employee_id)
         log_system_event(
             event_type='RESERVATION_CANCELLED',
             entity_type='reservation',
@@ -434,88 +513,100 @@ class ReservationApprove(Resource):
     @api.marshal_with(reservation_response)
     def patch(self, id):
         """Approve a reservation (only the ride driver can approve)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            # Get reservation with ride locked for update
-            reservation = Reservation.query.get(id)
-            if not reservation:
-                api.abort(404, 'Reservation not found')
-            
-            ride = Ride.query.with_for_update().get(reservation.ride_id)
-            
-            # Only driver can approve
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can approve reservations')
-            
-            # Can only approve PENDING reservations
-            if reservation.status != 'PENDING':
-                api.abort(400, f'Cannot approve reservation with status: {reservation.status}')
-            
-            # Check seat availability again
-            if reservation.seats_reserved > ride.available_seats:
-                api.abort(400, f'Not enough seats available. Required: {reservation.seats_reserved}, Available: {ride.available_seats}')
-            
-            # Deduct seats
-            ride.available_seats -= reservation.seats_reserved
-            
-            # Mark ride as FULL if no seats left
-            if ride.available_seats == 0:
-                ride.status = 'FULL'
-            
-            # Update reservation status
-            reservation.status = 'CONFIRMED'
-
-            short_destination = (ride.destination or '').split(',')[0].strip() or ride.destination
-            
-            # Create notification for the employee
-            notification = Notification(
-                employee_id=reservation.employee_id,
-                ride_id=ride.id,
-                message=f'Ride Approved! Your trip to {short_destination} is confirmed.',
-                type='approval',
-                is_read=False
-            )
-            db.session.add(notification)
-            
-            # Log system event for reservation confirmation
-            passenger = Employee.query.get(reservation.employee_id)
-            driver = Employee.query.get(employee_id)
-            log_system_event(
-                event_type='RESERVATION_CONFIRMED',
-                entity_type='reservation',
-                description=f'{driver.name if driver else "Driver"} confirmed {passenger.name if passenger else "passenger"}\'s reservation for ride #{ride.id}',
-                user_id=employee_id,
-                ride_id=ride.id,
-                reservation_id=reservation.id,
-                metadata={'seats_reserved': reservation.seats_reserved}
+        reservation = get_reservation_with_ride(id)
+        if not reservation:
+            api.abort(404, 'Reservation not found')
+        
+        ride = reservation.ride
+        
+        # Only driver can approve
+        if ride.driver_id != employee_id:
+            api.abort(403, 'Only the ride driver can approve reservations')
+        
+        # Can only approve PENDING reservations
+        if reservation.status != 'PENDING':
+            api.abort(400, f'Cannot approve reservation with status: {reservation.status}')
+        
+        # Claim the reservation: only one concurrent approval can move it
+        # out of PENDING, so seats are never deducted twice for it
+        claimed = db.session.execute(
+            update(Reservation)
+            .where(Reservation.id == reservation.id, Reservation.status == 'PENDING')
+            .values(status='CONFIRMED')
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount == 0:
+            api.abort(400, 'Cannot approve reservation - it is no longer pending')
+        set_committed_value(reservation, 'status', 'CONFIRMED')
+        
+        # Deduct seats atomically: the WHERE clause re-checks availability in the
+        # same statement, so concurrent approvals cannot oversell the ride.
+        # Ride is marked FULL when this booking takes the last seats, and the
+        # version is bumped so concurrent ORM updates of the ride go stale.
+        seats = reservation.seats_reserved
+        updated_ride = db.session.execute(
+            update(Ride)
+            .where(Ride.id == ride.id, Ride.available_seats >= seats)
+            .values(
+                available_seats=Ride.available_seats - seats,
+                status=case((Ride.available_seats == seats, 'FULL'), else_=Ride.status),
+                version=Ride.version + 1
             )
-            
-            db.session.commit()
+            .returning(Ride.available_seats, Ride.status, Ride.version)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if updated_ride is None:
+            db.session.rollback()
+            api.abort(400, f'Not enough seats available. Required: {seats}, Available: {ride.available_seats}')
+        for key, value in updated_ride._mapping.items():
+            set_committed_value(ride, key, value)
+        
+        # Create notification for the employee
+        notification = Notification(
+            employee_id=reservation.employee_id,
+            ride_id=ride.id,
+            message=RESERVATION_APPROVED_MESSAGE.format(destination=short_destination(ride)),
+            type='approval',
+            is_read=False
+        )
+        db.session.add(notification)
+        
+        # Log system event for reservation confirmation
+        passenger = db.session.get(Employee, reservation.employee_id)
+        driver = db.session.get(Employee, employee_id)
+        log_system_event(
+            event_type='RESERVATION_CONFIRMED',
+            entity_type='reservation',
+            description=f'{driver.name if driver else "Driver"} confirmed {passenger.name if passenger else "passenger"}\'s reservation for ride #{ride.id}',
+            user_id=employee_id,
+            ride_id=ride.id,
+            reservation_id=reservation.id,
+            metadata={'seats_reserved': reservation.seats_reserved}
+        )
+        
+        db.session.commit()
+        # The seat and status updates above are bulk statements, which bypass
+        # the mapper events that invalidate the ride list
+        cache.delete(RIDE_LIST_VERSION_KEY)
 
-            # Log reservation approval (console)
-            log_action(
-                action='RESERVATION_APPROVED',
-                employee_id=employee_id,
-                details={'reservation_id': reservation.id, 'ride_id': ride.id, 'seats_reserved': reservation.seats_reserved}
-            )
-            
-            # Emit real-time update for ride status change
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
+        # Log reservation approval (console)
+        log_action(
+            action='RESERVATION_APPROVED',
+            employee_id=employee_id,
+            details={'reservation_id': reservation.id, 'ride_id': ride.id, 'seats_reserved': reservation.seats_reserved}
+        )
+        
+        # Emit real-time update for ride status change
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
 
-            return reservation, 200
-            
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, 400) without modification
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Approval failed: {str(e)}')
+        return reservation, 200
 
 
 @api.route('/<int:id>/reject')
@@ -534,63 +625,53 @@ class ReservationReject(Resource):
     @api.marshal_with(reservation_response)
     def patch(self, id):
         """Reject a reservation (only the ride driver can reject)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            reservation = Reservation.query.get(id)
-            if not reservation:
-                api.abort(404, 'Reservation not found')
-            
-            ride = Ride.query.get(reservation.ride_id)
-            
-            # Only driver can reject
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can reject reservations')
-            
-            # Can only reject PENDING reservations
-            if reservation.status != 'PENDING':
-                api.abort(400, f'Cannot reject reservation with status: {reservation.status}')
-            
-            # Update reservation status (no seat changes)
-            reservation.status = 'REJECTED'
-
-            short_destination = (ride.destination or '').split(',')[0].strip() or ride.destination
-            
-            # Create notification for the employee
-            notification = Notification(
-                employee_id=reservation.employee_id,
-                ride_id=ride.id,
-                message=f'Trip Cancelled: Your ride to {short_destination} was cancelled.',
-                type='rejection',
-                is_read=False
-            )
-            db.session.add(notification)
-            
-            db.session.commit()
+        reservation = get_reservation_with_ride(id)
+        if not reservation:
+            api.abort(404, 'Reservation not found')
+        
+        ride = reservation.ride
+        
+        # Only driver can reject
+        if ride.driver_id != employee_id:
+            api.abort(403, 'Only the ride driver can reject reservations')
+        
+        # Can only reject PENDING reservations
+        if reservation.status != 'PENDING':
+            api.abort(400, f'Cannot reject reservation with status: {reservation.status}')
+        
+        # Update reservation status (no seat changes)
+        reservation.status = 'REJECTED'
+        
+        # Create notification for the employee
+        notification = Notification(
+            employee_id=reservation.employee_id,
+            ride_id=ride.id,
+            message=TRIP_CANCELLED_MESSAGE.format(destination=short_destination(ride)),
+            type='rejection',
+            is_read=False
+        )
+        db.session.add(notification)
+        
+        db.session.commit()
 
-            # Log reservation rejection
-            log_action(
-                action='RESERVATION_REJECTED',
-                employee_id=employee_id,
-                details={'reservation_id': reservation.id, 'ride_id': ride.id, 'seats_reserved': reservation.seats_reserved}
-            )
-            
-            # Emit real-time update for ride status (rejection doesn't change ride status, but notify clients)
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
+        # Log reservation rejection
+        log_action(
+            action='RESERVATION_REJECTED',
+            employee_id=employee_id,
+            details={'reservation_id': reservation.id, 'ride_id': ride.id, 'seats_reserved': reservation.seats_reserved}
+        )
+        
+        # Emit real-time update for ride status (rejection doesn't change ride status, but notify clients)
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
 
-            return reservation, 200
-            
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, 400) without modification
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Rejection failed: {str(e)}')
+        return reservation, 200
 
 
 @api.route('/<int:id>')
@@ -608,9 +689,9 @@ class ReservationDetail(Resource):
     )
     def delete(self, id):
         """Delete a completed reservation (only cancelled/rejected or from completed rides)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        reservation = Reservation.query.get(id)
+        reservation = get_reservation_with_ride(id)
         if not reservation:
             api.abort(404, 'Reservation not found')
         
@@ -620,7 +701,7 @@ class ReservationDetail(Resource):
         
         # Check if reservation can be deleted (must be cancelled, rejected, or from a completed/cancelled ride)
         reservation_status = (reservation.status or '').upper()
-        ride = Ride.query.get(reservation.ride_id)
+        ride = reservation.ride
         ride_status = (ride.status or 'scheduled').lower() if ride else 'unknown'
         
         # Allow deletion if:
@@ -664,36 +745,32 @@ class ReservationConfirmBoarding(Resource):
     )
     def post(self, id):
         """Confirm passenger boarding within the boarding deadline"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            # Check and expire any boarding deadlines before processing
-            check_and_expire_boarding_deadlines()
-            
-            success, message = confirm_boarding(id, employee_id)
-            
-            if success:
-                # Log system event for passenger boarding
-                reservation = Reservation.query.get(id)
-                passenger = Employee.query.get(employee_id)
-                if reservation:
-                    log_system_event(
-                        event_type='PASSENGER_BOARDED',
-                        entity_type='reservation',
-                        description=f'{passenger.name if passenger else "Passenger"} boarded ride #{reservation.ride_id}',
-                        user_id=employee_id,
-                        ride_id=reservation.ride_id,
-                        reservation_id=id
-                    )
-                
-                log_action(
-                    action='BOARDING_CONFIRMED',
-                    employee_id=employee_id,
-                    details={'reservation_id': id}
+        # Check and expire any boarding deadlines before processing
+        check_and_expire_boarding_deadlines()
+        
+        success, message = confirm_boarding(id, employee_id)
+        
+        if success:
+            # Log system event for passenger boarding
+            reservation = db.session.get(Reservation, id)
+            passenger = db.session.get(Employee, employee_id)
+            if reservation:
+                log_system_event(
+                    event_type='PASSENGER_BOARDED',
+                    entity_type='reservation',
+                    description=f'{passenger.name if passenger else "Passenger"} boarded ride #{reservation.ride_id}',
+                    user_id=employee_id,
+                    ride_id=reservation.ride_id,
+                    reservation_id=id
                 )
-                return {'message': message, 'reservation_id': id, 'boarded': True}, 200
-            else:
-                return {'error': 'BOARDING_FAILED', 'message': message}, 400
-                
-        except Exception as e:
-            return {'error': 'INTERNAL_ERROR', 'message': str(e)}, 500
+            
+            log_action(
+                action='BOARDING_CONFIRMED',
+                employee_id=employee_id,
+                details={'reservation_id': id}
+            )
+            return {'message': message, 'reservation_id': id, 'boarded': True}, 200
+        else:
+            return {'error': 'BOARDING_FAILED', 'message': message}, 400
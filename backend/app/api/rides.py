@@ -1,15 +1,27 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import defaultdict
 from datetime import datetime
-from werkzeug.exceptions import HTTPException
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.orm import joinedload, load_only, raiseload, undefer
 import logging
+import secrets
+from urllib.parse import urlencode
 
-from app.extensions import db, socketio
+import orjson
+
+from app.api import current_employee_id
+from app.api.notifications import notification_list_cache_key
+from app.extensions import db, socketio, cache
 from app.models import Ride, Employee, Reservation, Notification
 from app.models.system_event import log_system_event
+from app.utils.cache import RIDE_LIST_VERSION_KEY
+from app.utils.concurrency import retry_on_conflict
+from app.utils.dates import parse_iso_datetime
 from app.utils.logger import log_action
-from app.utils.geo import matches_ride_location, PICKUP_RADIUS_KM, DESTINATION_RADIUS_KM
+from app.utils.geo import bounding_box, matches_ride_location, PICKUP_RADIUS_KM, DESTINATION_RADIUS_KM
 from app.realtime_events import emit_ride_status_update
 from app.services.ride_expiration_service import check_and_expire_rides
 from app.services.boarding_service import set_boarding_deadlines, check_and_expire_boarding_deadlines
@@ -20,6 +32,69 @@ logger = logging.getLogger(__name__)
 
 api = Namespace('rides', description='Ride operations')
 
+# Rides fetched per round trip when scanning coordinate search candidates
+COORDINATE_SEARCH_BATCH_SIZE = 200
+
+# Short-lived cache of ride ownership for the driver-only read endpoints
+RIDE_OWNER_CACHE_TTL = 30
+
+
+def ride_owner_cache_key(ride_id):
+    return f'ride_owner:{ride_id}'
+
+
+# Any committed change to a ride drops its cached owner
+cache.invalidate_on((Ride,), lambda r: ride_owner_cache_key(r.id))
+
+
+# Ride list pages are shared by every user asking with the same query string.
+# Each cached page embeds the current list version; any committed change to a
+# ride or reservation drops the version so all pages go stale at once. Driver
+# fields only change through update_employee_profile, which drops it itself.
+RIDE_LIST_CACHE_TTL = 30
+RIDE_LIST_VERSION_TTL = 24 * 60 * 60
+
+cache.invalidate_on((Ride, Reservation), RIDE_LIST_VERSION_KEY)
+
+
+def ride_list_cache_key():
+    """Cache key for the current request's ride list query string."""
+    version = cache.get(RIDE_LIST_VERSION_KEY)
+    if version is None:
+        version = secrets.token_hex(8)
+        cache.set(RIDE_LIST_VERSION_KEY, version, RIDE_LIST_VERSION_TTL)
+    return f'ride_list:{version}:{urlencode(sorted(request.args.items(multi=True)))}'
+
+
+def get_ride_driver_id(ride_id):
+    """Return the driver of ride_id, or None if the ride does not exist."""
+    cached = cache.get(ride_owner_cache_key(ride_id))
+    if cached is not None:
+        return cached['driver_id']
+
+    driver_id = db.session.scalar(select(Ride.driver_id).where(Ride.id == ride_id))
+    if driver_id is not None:
+        cache.set(ride_owner_cache_key(ride_id), {'driver_id': driver_id}, RIDE_OWNER_CACHE_TTL)
+    return driver_id
+
+
+def get_driven_ride(ride_id, employee_id, forbidden_message, options=()):
+    """Load ride_id for its driver, aborting with 404/403 otherwise.
+
+    Ownership is part of the SELECT, so another driver's ride is never
+    loaded; the cached owner lookup only runs on a miss to tell a missing
+    ride from a forbidden one.
+    """
+    ride = db.session.scalars(
+        select(Ride).options(*options).where(Ride.id == ride_id, Ride.driver_id == employee_id)
+    ).first()
+    if ride is None:
+        if get_ride_driver_id(ride_id) is None:
+            api.abort(404, 'Ride not found')
+        api.abort(403, forbidden_message)
+    return ride
+
+
 # Error response model
 error_response = api.model('ErrorResponse', {
     'error': fields.String(description='Error code (e.g., VALIDATION_ERROR, NOT_FOUND, UNAUTHORIZED, FORBIDDEN, INTERNAL_ERROR)'),
@@ -71,60 +146,64 @@ paginated_rides_response = api.model('PaginatedRidesResponse', {
     'page': fields.Integer(description='Current page number'),
     'per_page': fields.Integer(description='Items per page'),
     'total_items': fields.Integer(description='Total number of items'),
-    'total_pages': fields.Integer(description='Total number of pages')
+    'total_pages': fields.Integer(description='Total number of pages'),
+    'next_cursor': fields.String(description='Cursor for the next page (cursor pagination only; null on the last page)')
 })
 
 
-def serialize_ride_with_reservations(ride):
-    """Helper function to serialize a ride with its reservations"""
-    # Fetch reservations with passenger details
-    reservations = db.session.query(
-        Reservation.id,
-        Reservation.employee_id,
-        Reservation.seats_reserved,
-        Reservation.status,
-        Reservation.boarding_deadline,
-        Reservation.boarded,
-        Reservation.created_at,
-        Employee.name,
-        Employee.email
-    ).join(
-        Employee, Reservation.employee_id == Employee.id
-    ).filter(
-        Reservation.ride_id == ride.id
+# Reservation columns (with passenger details) embedded in ride responses
+RIDE_RESERVATION_COLUMNS = (
+    Reservation.id,
+    Reservation.ride_id,
+    Reservation.employee_id,
+    Reservation.seats_reserved,
+    Reservation.status,
+    Reservation.boarding_deadline,
+    Reservation.boarded,
+    Reservation.created_at,
+    Employee.name,
+    Employee.email
+)
+
+
+def _ride_reservations(*criteria):
+    """Reservations with passenger name/email matching criteria."""
+    return db.session.execute(
+        select(*RIDE_RESERVATION_COLUMNS)
+        .join(Employee, Reservation.employee_id == Employee.id)
+        .where(*criteria)
+        .order_by(Reservation.id)
     ).all()
-    
-    # Get driver name and car info
-    driver = Employee.query.get(ride.driver_id)
-    driver_name = driver.name if driver else None
-    driver_car_model = driver.car_model if driver else None
-    driver_car_color = driver.car_color if driver else None
-    
+
+
+def _serialize_ride(ride, driver, reservations):
+    # Datetimes are left as-is: the orjson representation encodes them natively
+    # in the same ISO 8601 form isoformat() produced
     return {
         'id': ride.id,
         'driver_id': ride.driver_id,
-        'driver_name': driver_name,
-        'driver_car_model': driver_car_model,
-        'driver_car_color': driver_car_color,
+        'driver_name': driver.name if driver else None,
+        'driver_car_model': driver.car_model if driver else None,
+        'driver_car_color': driver.car_color if driver else None,
         'origin': ride.origin,
         'destination': ride.destination,
         'origin_lat': ride.origin_lat,
         'origin_lng': ride.origin_lng,
         'destination_lat': ride.destination_lat,
         'destination_lng': ride.destination_lng,
-        'departure_time': ride.departure_time.isoformat() if ride.departure_time else None,
+        'departure_time': ride.departure_time,
         'available_seats': ride.available_seats,
         'status': ride.status,
-        'created_at': ride.created_at.isoformat() if ride.created_at else None,
+        'created_at': ride.created_at,
         'reservations': [
             {
                 'id': r.id,
                 'employee_id': r.employee_id,
                 'seats_reserved': r.seats_reserved,
                 'status': r.status,
-                'boarding_deadline': r.boarding_deadline.isoformat() if r.boarding_deadline else None,
+                'boarding_deadline': r.boarding_deadline,
                 'boarded': r.boarded,
-                'created_at': r.created_at.isoformat() if r.created_at else None,
+                'created_at': r.created_at,
                 'passenger_name': r.name,
                 'passenger_email': r.email
             }
@@ -133,9 +212,60 @@ def serialize_ride_with_reservations(ride):
     }
 
 
+def _within_box(lat_column, lng_column, lat, lng, radius_km):
+    """SQL criteria keeping coordinates inside the radius's bounding box."""
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    criteria = [lat_column.between(min_lat, max_lat)]
+    if min_lng is not None:
+        criteria.append(lng_column.between(min_lng, max_lng))
+    return criteria
+
+
+def _encode_ride_cursor(ride):
+    """Opaque keyset cursor for the (departure_time, id) of the last ride on a page."""
+    return urlsafe_b64encode(orjson.dumps([ride.departure_time.isoformat(), ride.id])).decode()
+
+
+def _decode_ride_cursor(cursor):
+    try:
+        departure_time, ride_id = orjson.loads(urlsafe_b64decode(cursor))
+        return parse_iso_datetime(departure_time), int(ride_id)
+    except (ValueError, TypeError):
+        api.abort(400, 'Invalid cursor')
+
+
+def _parse_date_filter(name, value, end_of_day=False):
+    """Parse a date or datetime query parameter with the C ISO parser.
+
+    Date-only values (YYYY-MM-DD) map to 00:00:00, or 23:59:59 with end_of_day.
+    """
+    try:
+        parsed = parse_iso_datetime(value)
+    except ValueError:
+        api.abort(400, f'Invalid {name} format. Use ISO date (YYYY-MM-DD) or datetime (2026-02-10T10:00:00)')
+    if end_of_day and 'T' not in value:
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed
+
+
+def serialize_ride_with_reservations(ride):
+    """Helper function to serialize a ride with its reservations"""
+    # Identity-map hit when the caller already loaded the driver
+    driver = db.session.get(Employee, ride.driver_id)
+    return _serialize_ride(ride, driver, _ride_reservations(Reservation.ride_id == ride.id))
+
+
 def serialize_rides_list(rides):
-    """Helper function to serialize a list of rides with reservations"""
-    return [serialize_ride_with_reservations(ride) for ride in rides]
+    """Serialize a list of rides with reservations.
+
+    Reservations for the whole page are fetched in one IN query; each ride's
+    driver must already be loaded (RideList joins it in).
+    """
+    reservations_by_ride = defaultdict(list)
+    if rides:
+        for r in _ride_reservations(Reservation.ride_id.in_([ride.id for ride in rides])):
+            reservations_by_ride[r.ride_id].append(r)
+    return [_serialize_ride(ride, ride.driver, reservations_by_ride[ride.id]) for ride in rides]
 
 @api.route('/')
 class RideList(Resource):
@@ -151,8 +281,11 @@ class RideList(Resource):
             'date_from': {'description': 'Filter rides from this date (ISO datetime)', 'type': 'string', 'required': False},
             'date_to': {'description': 'Filter rides up to this date (ISO datetime)', 'type': 'string', 'required': False},
             'driver_id': {'description': 'Filter by driver ID (for getting my offered rides)', 'type': 'integer', 'required': False},
+            'status': {'description': 'Filter by ride status', 'type': 'string', 'required': False, 'enum': Ride.VALID_STATUSES},
+            'upcoming': {'description': 'Only rides departing from now on', 'type': 'boolean', 'required': False, 'default': False},
             'sort_by': {'description': 'Sort results: date_asc (default) or date_desc', 'type': 'string', 'required': False, 'enum': ['date_asc', 'date_desc']},
             'page': {'description': 'Page number (default: 1)', 'type': 'integer', 'required': False, 'default': 1},
+            'cursor': {'description': 'Keyset pagination: pass an empty value for the first page, then next_cursor (replaces page and totals; ignored for coordinate search)', 'type': 'string', 'required': False},
             'per_page': {'description': 'Items per page (default: 10, max: 50)', 'type': 'integer', 'required': False, 'default': 10}
         },
         responses={
@@ -161,7 +294,8 @@ class RideList(Resource):
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_with(paginated_rides_response)
+    # serialize_rides_list already emits the model's shape; skip re-marshalling
+    @api.response(200, 'Success', paginated_rides_response)
     def get(self):
         """List all rides with optional filtering, sorting, and pagination"""
         # Lazy expiration and termination checks
@@ -171,11 +305,30 @@ class RideList(Resource):
             check_and_terminate_rides()
         except Exception as e:
             # Log but don't fail the request
-            import logging
-            logging.getLogger(__name__).error(f'Expiration/termination check failed: {e}')
+            logger.error(f'Expiration/termination check failed: {e}')
+
+        # Taken before querying, so a page built from data that changes
+        # meanwhile is stored under the version that change invalidates
+        cache_key = ride_list_cache_key()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Base query: exclude soft-deleted rides
-        query = Ride.query.filter(Ride.is_deleted == False)
+        # Base query: exclude soft-deleted rides. Only the columns the serializer
+        # and coordinate matching read are loaded; the driver columns come back in
+        # the same row via a join and any other relationship access raises instead
+        # of issuing one query per ride
+        query = Ride.query.options(
+            load_only(
+                Ride.id, Ride.driver_id, Ride.origin, Ride.destination,
+                Ride.origin_lat, Ride.origin_lng, Ride.destination_lat, Ride.destination_lng,
+                Ride.departure_time, Ride.available_seats, Ride.status, Ride.created_at
+            ),
+            joinedload(Ride.driver).load_only(
+                Employee.id, Employee.name, Employee.car_model, Employee.car_color
+            ),
+            raiseload('*')
+        ).filter(Ride.is_deleted == False)
         
         # Coordinate-based location filters (replaces string-based matching)
         origin_lat = request.args.get('origin_lat', type=float)
@@ -223,6 +376,15 @@ class RideList(Resource):
                 'has_dest': has_dest_coords
             }
 
+        # Status / upcoming filters run in SQL (ix_rides_status_departure)
+        status = request.args.get('status')
+        if status:
+            if status not in Ride.VALID_STATUSES:
+                api.abort(400, f'status must be one of: {", ".join(Ride.VALID_STATUSES)}')
+            query = query.filter(Ride.status == status)
+        if request.args.get('upcoming', 'false').lower() in ('1', 'true'):
+            query = query.filter(Ride.departure_time >= datetime.utcnow())
+
         # Driver filter (for getting my offered rides)
         driver_id = request.args.get('driver_id')
         if driver_id:
@@ -236,61 +398,43 @@ class RideList(Resource):
         date_to = request.args.get('date_to')
 
         if date_from:
-            try:
-                # Handle both date-only (YYYY-MM-DD) and datetime formats
-                if 'T' in date_from:
-                    date_from_dt = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                else:
-                    # Parse date-only format and set to start of day
-                    date_from_dt = datetime.fromisoformat(f'{date_from}T00:00:00')
-                query = query.filter(Ride.departure_time >= date_from_dt)
-            except ValueError:
-                api.abort(400, 'Invalid date_from format. Use ISO date (YYYY-MM-DD) or datetime (2026-02-10T10:00:00)')
+            # Date-only values start at the beginning of the day
+            date_from_dt = _parse_date_filter('date_from', date_from)
+            query = query.filter(Ride.departure_time >= date_from_dt)
 
         if date_to:
-            try:
-                # Handle both date-only (YYYY-MM-DD) and datetime formats
-                if 'T' in date_to:
-                    date_to_dt = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
-                else:
-                    # Parse date-only format and set to end of day
-                    date_to_dt = datetime.fromisoformat(f'{date_to}T23:59:59')
-                query = query.filter(Ride.departure_time <= date_to_dt)
-            except ValueError:
-                api.abort(400, 'Invalid date_to format. Use ISO date (YYYY-MM-DD) or datetime (2026-02-10T10:00:00)')
+            # Date-only values run to the end of the day
+            date_to_dt = _parse_date_filter('date_to', date_to, end_of_day=True)
+            query = query.filter(Ride.departure_time <= date_to_dt)
 
-        # Validate date range
-        if date_from and date_to:
-            try:
-                if 'T' in date_from:
-                    date_from_dt = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                else:
-                    date_from_dt = datetime.fromisoformat(f'{date_from}T00:00:00')
-                
-                if 'T' in date_to:
-                    date_to_dt = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
-                else:
-                    date_to_dt = datetime.fromisoformat(f'{date_to}T23:59:59')
-                
-                if date_from_dt > date_to_dt:
-                    api.abort(400, 'date_from cannot be later than date_to')
-            except ValueError:
-                api.abort(400, 'Invalid date format in range validation')
+        # Validate date range (reuses the values parsed above)
+        if date_from and date_to and date_from_dt > date_to_dt:
+            api.abort(400, 'date_from cannot be later than date_to')
 
-        # Sorting
+        # Sorting; id breaks departure_time ties so pages are stable
         sort_by = request.args.get('sort_by', 'date_asc')
-        if sort_by == 'date_desc':
-            query = query.order_by(Ride.departure_time.desc())
+        descending = sort_by == 'date_desc'
+        if descending:
+            query = query.order_by(Ride.departure_time.desc(), Ride.id.desc())
         else:
-            query = query.order_by(Ride.departure_time.asc())
+            query = query.order_by(Ride.departure_time.asc(), Ride.id.asc())
 
         # Apply coordinate-based filtering BEFORE pagination
         # This ensures accurate pagination counts
         if coordinate_search:
-            all_rides = query.all()
+            # Narrow candidates in SQL to the bounding boxes of the search radii,
+            # then stream them in batches for the exact distance check
+            if has_origin_coords:
+                query = query.filter(*_within_box(
+                    Ride.origin_lat, Ride.origin_lng, origin_lat, origin_lng, pickup_radius
+                ))
+            if has_dest_coords:
+                query = query.filter(*_within_box(
+                    Ride.destination_lat, Ride.destination_lng, destination_lat, destination_lng, destination_radius
+                ))
             filtered_rides = []
             
-            for ride in all_rides:
+            for ride in query.yield_per(COORDINATE_SEARCH_BATCH_SIZE):
                 if matches_ride_location(
                     coordinate_search['origin_lat'],
                     coordinate_search['origin_lng'],
@@ -346,6 +490,24 @@ class RideList(Resource):
             if per_page < 1 or per_page > 50:
                 api.abort(400, 'per_page must be between 1 and 50')
 
+            cursor = request.args.get('cursor')
+            if cursor is not None:
+                # Keyset pagination: seek past the cursor's (departure_time, id)
+                # instead of OFFSET, and fetch one extra row rather than COUNT(*)
+                if cursor:
+                    position = tuple_(Ride.departure_time, Ride.id)
+                    last_seen = tuple_(*_decode_ride_cursor(cursor))
+                    query = query.filter(position < last_seen if descending else position > last_seen)
+                rides = query.limit(per_page + 1).all()
+                page_items = rides[:per_page]
+                response = {
+                    'items': serialize_rides_list(page_items),
+                    'per_page': per_page,
+                    'next_cursor': _encode_ride_cursor(page_items[-1]) if len(rides) > per_page else None
+                }
+                cache.set(cache_key, response, RIDE_LIST_CACHE_TTL)
+                return response
+
             pagination = query.paginate(page=page, per_page=per_page, error_out=False)
         
         serialized_items = serialize_rides_list(pagination.items)
@@ -359,17 +521,13 @@ class RideList(Resource):
         # This happens silently and does not affect the API response
         if is_passenger_search and len(serialized_items) == 0:
             try:
-                current_user_id = get_jwt_identity()
+                current_user_id = current_employee_id()
                 
                 # Only create request if we have complete search parameters
                 if has_origin_coords and has_dest_coords and date_from:
-                    # Parse departure time from date_from parameter
+                    # Departure time is the date_from filter parsed above
+                    departure_time = date_from_dt
                     try:
-                        if 'T' in date_from:
-                            departure_time = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                        else:
-                            departure_time = datetime.fromisoformat(f'{date_from}T00:00:00')
-                        
                         # Determine country from coordinates (simple heuristic)
                         # Tunisia: roughly 30-38°N, 7-12°E
                         # France: roughly 41-51°N, -5-10°E
@@ -398,13 +556,18 @@ class RideList(Resource):
                 # Silently catch any errors - passenger request creation should never break search
                 logger.error(f"Error in passenger request creation: {str(e)}")
 
-        return {
+        response = {
             'items': serialized_items,
             'page': pagination.page,
             'per_page': pagination.per_page,
             'total_items': pagination.total,
             'total_pages': pagination.pages
         }
+        # Empty passenger searches are not cached: each one must still reach
+        # the passenger request creation above
+        if serialized_items or not is_passenger_search:
+            cache.set(cache_key, response, RIDE_LIST_CACHE_TTL)
+        return response
 
     @jwt_required()
     @api.doc('create_ride', security='Bearer',
@@ -419,18 +582,24 @@ class RideList(Resource):
     @api.marshal_with(ride_response)
     def post(self):
         """Offer a new ride"""
-        data = request.get_json()
+        data = request.get_json() or {}
         if data.get('available_seats', 0) <= 0:
             api.abort(400, 'available_seats must be greater than 0')
         
         # Get driver_id from JWT token instead of request body
-        driver_id = int(get_jwt_identity())
-        driver = Employee.query.get(driver_id)
-        if not driver:
+        driver_id = current_employee_id()
+        # Only the columns shown in the response and event description
+        driver = db.session.execute(
+            select(Employee.name, Employee.car_model, Employee.car_color).where(Employee.id == driver_id)
+        ).first()
+        if driver is None:
             api.abort(404, 'Driver not found')
         
         # Part 4: Validate departure_time is in the future
-        departure_time = datetime.fromisoformat(data['departure_time'])
+        try:
+            departure_time = parse_iso_datetime(data['departure_time'])
+        except ValueError:
+            api.abort(400, 'departure_time must be an ISO 8601 datetime')
         if departure_time <= datetime.utcnow():
             api.abort(400, 'Departure time must be in the future. Cannot create rides with past departure times.')
         
@@ -448,25 +617,33 @@ class RideList(Resource):
         db.session.add(ride)
         
         # Log system event for ride creation
-        log_system_event(
+        event = log_system_event(
             event_type='RIDE_CREATED',
             entity_type='ride',
             description=f'{driver.name} created ride from {ride.origin} to {ride.destination}',
             user_id=driver_id,
-            ride_id=ride.id,
             metadata={'origin': ride.origin, 'destination': ride.destination, 'seats': ride.available_seats}
         )
+        if event:
+            # ride.id is not assigned until the INSERT; the relationship lets the
+            # flush fill in ride_id
+            event.ride = ride
         
+        # INSERT ... RETURNING assigns the id and server defaults; serialize before
+        # commit expires the instance, so the response needs no refresh SELECT
+        # (a new ride has no reservations to load)
+        db.session.flush()
+        response = _serialize_ride(ride, driver, [])
         db.session.commit()
 
         # Log ride creation (console logging)
         log_action(
             action='RIDE_CREATED',
             employee_id=driver_id,
-            details={'ride_id': ride.id, 'origin': ride.origin, 'destination': ride.destination}
+            details={'ride_id': response['id'], 'origin': response['origin'], 'destination': response['destination']}
         )
 
-        return ride, 201
+        return response, 201
 
 
 @api.route('/<int:id>')
@@ -488,7 +665,8 @@ class RideDetail(Resource):
         except Exception as e:
             logger.error(f'Termination check failed: {e}')
         
-        ride = Ride.query.get(id)
+        # The driver comes back in the same row, so serializing it needs no lookup
+        ride = db.session.get(Ride, id, options=[joinedload(Ride.driver)])
         if not ride:
             api.abort(404, 'Ride not found')
         return serialize_ride_with_reservations(ride)
@@ -505,38 +683,25 @@ class RideDetail(Resource):
     )
     def delete(self, id):
         """Soft delete a ride (only the driver can delete completed or cancelled rides)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            ride = Ride.query.get(id)
-            
-            if not ride:
-                api.abort(404, 'Ride not found')
-            
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can delete the ride')
-            
-            # Only allow deletion of terminal state rides (completed, cancelled, missed)
-            if ride.status not in ['completed', 'cancelled', 'missed', 'COMPLETED', 'CANCELLED']:
-                api.abort(400, f'Cannot delete ride with status {ride.status}. Only completed, cancelled, or missed rides can be deleted.')
-            
-            # Soft delete - mark as deleted instead of removing from database
-            ride.is_deleted = True
-            db.session.commit()
-            
-            log_action(
-                action='RIDE_DELETED',
-                employee_id=employee_id,
-                details={'ride_id': ride.id, 'status': ride.status, 'origin': ride.origin, 'destination': ride.destination}
-            )
-            
-            return {'message': 'Ride deleted successfully', 'ride_id': ride.id}, 200
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Failed to delete ride: {str(e)}')
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can delete the ride')
+        
+        # Only allow deletion of terminal state rides (completed, cancelled, missed)
+        if ride.status not in ['completed', 'cancelled', 'missed', 'COMPLETED', 'CANCELLED']:
+            api.abort(400, f'Cannot delete ride with status {ride.status}. Only completed, cancelled, or missed rides can be deleted.')
+        
+        # Soft delete - mark as deleted instead of removing from database
+        ride.is_deleted = True
+        db.session.commit()
+        
+        log_action(
+            action='RIDE_DELETED',
+            employee_id=employee_id,
+            details={'ride_id': ride.id, 'status': ride.status, 'origin': ride.origin, 'destination': ride.destination}
+        )
+        
+        return {'message': 'Ride deleted successfully', 'ride_id': ride.id}, 200
 
     @jwt_required()
     @api.doc('update_ride', security='Bearer', description='Update ride details (only by driver). Cannot update COMPLETED rides.',
@@ -550,36 +715,35 @@ class RideDetail(Resource):
     )
     @api.expect(ride_create)
     @api.marshal_with(ride_response)
+    @retry_on_conflict()
     def put(self, id):
         """Update a ride (only the driver can update)"""
-        employee_id = int(get_jwt_identity())
-        ride = Ride.query.get(id)
-        
-        if not ride:
-            api.abort(404, 'Ride not found')
-        
-        # Only driver can update
-        if ride.driver_id != employee_id:
-            api.abort(403, 'Only the ride driver can update it')
+        employee_id = current_employee_id()
+        data = request.get_json() or {}
+        # Seat changes are validated against reserved seats, loaded in the same SELECT
+        options = [undefer(Ride.reserved_seats)] if 'available_seats' in data else []
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can update it', options=options)
         
         # Cannot update completed rides
         if ride.status == 'COMPLETED':
             api.abort(400, 'Cannot update a completed ride')
         
-        data = request.get_json() or {}
-        
         # Update fields if provided
         if 'origin' in data:
             ride.origin = data['origin']
         if 'destination' in data:
             ride.destination = data['destination']
         if 'departure_time' in data:
-            ride.departure_time = datetime.fromisoformat(data['departure_time'])
+            try:
+                ride.departure_time = parse_iso_datetime(data['departure_time'])
+            except ValueError:
+                api.abort(400, 'departure_time must be an ISO 8601 datetime')
         if 'available_seats' in data:
-            # Check if new seats would be less than already reserved
-            reserved_seats = db.session.query(db.func.sum(Reservation.seats_reserved)) \
-                .filter_by(ride_id=ride.id, status='CONFIRMED') \
-                .scalar() or 0
+            # Check if new seats would be less than already reserved. If the ride
+            # was already in the session the value is lazy-loaded; don't let that
+            # SELECT flush the field changes above before validation passes
+            with db.session.no_autoflush:
+                reserved_seats = ride.reserved_seats
             
             new_seats = data['available_seats']
             if new_seats < reserved_seats:
@@ -609,43 +773,30 @@ class RideStart(Resource):
     )
     def patch(self, id):
         """Start ride - driver en route (only the driver can start)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            ride = Ride.query.get(id)
-            
-            if not ride:
-                api.abort(404, 'Ride not found')
-            
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can start the ride')
-            
-            if not ride.can_transition_to('driver_en_route'):
-                api.abort(400, f'Cannot transition from {ride.status} to driver_en_route')
-            
-            ride.status = 'driver_en_route'
-            db.session.commit()
-            
-            log_action(
-                action='RIDE_STARTED',
-                employee_id=employee_id,
-                details={'ride_id': ride.id, 'new_status': 'driver_en_route'}
-            )
-            
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
-            
-            return serialize_ride_with_reservations(ride), 200
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Failed to start ride: {str(e)}')
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can start the ride')
+        
+        if not ride.can_transition_to('driver_en_route'):
+            api.abort(400, f'Cannot transition from {ride.status} to driver_en_route')
+        
+        ride.status = 'driver_en_route'
+        db.session.commit()
+        
+        log_action(
+            action='RIDE_STARTED',
+            employee_id=employee_id,
+            details={'ride_id': ride.id, 'new_status': 'driver_en_route'}
+        )
+        
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
+        
+        return serialize_ride_with_reservations(ride), 200
 
 
 @api.route('/<int:id>/arrive')
@@ -663,47 +814,34 @@ class RideArrive(Resource):
     )
     def patch(self, id):
         """Mark driver as arrived (only the driver can mark arrival)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            ride = Ride.query.get(id)
-            
-            if not ride:
-                api.abort(404, 'Ride not found')
-            
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can mark arrival')
-            
-            if not ride.can_transition_to('arrived'):
-                api.abort(400, f'Cannot transition from {ride.status} to arrived')
-            
-            ride.status = 'arrived'
-            db.session.commit()
-            
-            # Note: Boarding deadlines are NOT set here anymore
-            # Passengers can confirm boarding anytime during 'arrived' status
-            # Timer starts when driver presses "Begin Ride"
-            
-            log_action(
-                action='RIDE_DRIVER_ARRIVED',
-                employee_id=employee_id,
-                details={'ride_id': ride.id, 'new_status': 'arrived'}
-            )
-            
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
-            
-            return serialize_ride_with_reservations(ride), 200
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Failed to mark arrival: {str(e)}')
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can mark arrival')
+        
+        if not ride.can_transition_to('arrived'):
+            api.abort(400, f'Cannot transition from {ride.status} to arrived')
+        
+        ride.status = 'arrived'
+        db.session.commit()
+        
+        # Note: Boarding deadlines are NOT set here anymore
+        # Passengers can confirm boarding anytime during 'arrived' status
+        # Timer starts when driver presses "Begin Ride"
+        
+        log_action(
+            action='RIDE_DRIVER_ARRIVED',
+            employee_id=employee_id,
+            details={'ride_id': ride.id, 'new_status': 'arrived'}
+        )
+        
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
+        
+        return serialize_ride_with_reservations(ride), 200
 
 
 @api.route('/<int:id>/begin')
@@ -721,65 +859,52 @@ class RideBegin(Resource):
     )
     def patch(self, id):
         """Begin ride journey (only the driver can begin)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            ride = Ride.query.get(id)
-            
-            if not ride:
-                api.abort(404, 'Ride not found')
-            
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can begin the ride')
-            
-            if not ride.can_transition_to('in_progress'):
-                api.abort(400, f'Cannot transition from {ride.status} to in_progress')
-            
-            # NEW LOGIC: Set boarding deadlines NOW (when driver presses Begin Ride)
-            # This starts the 5-minute timer for passengers who haven't confirmed yet
-            # Passengers who already confirmed (boarded=True) won't get a deadline
-            set_boarding_deadlines(ride.id)
-            
-            ride.status = 'in_progress'
-            ride.updated_at = datetime.utcnow()
-            
-            # Log system event for ride started
-            driver = Employee.query.get(employee_id)
-            log_system_event(
-                event_type='RIDE_STARTED',
-                entity_type='ride',
-                description=f'{driver.name if driver else "Driver"} started ride #{ride.id}',
-                user_id=employee_id,
-                ride_id=ride.id,
-                metadata={'origin': ride.origin, 'destination': ride.destination}
-            )
-            
-            db.session.commit()
-            
-            # Schedule a check for boarding deadline expiration
-            # This will be handled by lazy evaluation on subsequent API calls
-            logger.info(f'Ride {ride.id} began - boarding deadlines set for unconfirmed passengers')
-            
-            log_action(
-                action='RIDE_BEGUN',
-                employee_id=employee_id,
-                details={'ride_id': ride.id, 'new_status': 'in_progress'}
-            )
-            
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
-            
-            return serialize_ride_with_reservations(ride), 200
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Failed to begin ride: {str(e)}')
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can begin the ride')
+        
+        if not ride.can_transition_to('in_progress'):
+            api.abort(400, f'Cannot transition from {ride.status} to in_progress')
+        
+        # NEW LOGIC: Set boarding deadlines NOW (when driver presses Begin Ride)
+        # This starts the 5-minute timer for passengers who haven't confirmed yet
+        # Passengers who already confirmed (boarded=True) won't get a deadline
+        set_boarding_deadlines(ride.id)
+        
+        ride.status = 'in_progress'
+        ride.updated_at = datetime.utcnow()
+        
+        # Log system event for ride started
+        driver = db.session.get(Employee, employee_id)
+        log_system_event(
+            event_type='RIDE_STARTED',
+            entity_type='ride',
+            description=f'{driver.name if driver else "Driver"} started ride #{ride.id}',
+            user_id=employee_id,
+            ride_id=ride.id,
+            metadata={'origin': ride.origin, 'destination': ride.destination}
+        )
+        
+        db.session.commit()
+        
+        # Schedule a check for boarding deadline expiration
+        # This will be handled by lazy evaluation on subsequent API calls
+        logger.info(f'Ride {ride.id} began - boarding deadlines set for unconfirmed passengers')
+        
+        log_action(
+            action='RIDE_BEGUN',
+            employee_id=employee_id,
+            details={'ride_id': ride.id, 'new_status': 'in_progress'}
+        )
+        
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
+        
+        return serialize_ride_with_reservations(ride), 200
 
 
 @api.route('/<int:id>/complete')
@@ -797,64 +922,51 @@ class RideComplete(Resource):
     )
     def patch(self, id):
         """Complete ride (only the driver can complete)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            ride = Ride.query.get(id)
-            
-            if not ride:
-                api.abort(404, 'Ride not found')
-            
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can complete the ride')
-            
-            if not ride.can_transition_to('completed'):
-                api.abort(400, f'Cannot transition from {ride.status} to completed')
-            
-            ride.status = 'completed'
-            
-            # Update all CONFIRMED reservations to completed
-            reservations = Reservation.query.filter_by(
-                ride_id=ride.id,
-                status='CONFIRMED'
-            ).all()
-            
-            for reservation in reservations:
-                reservation.status = 'COMPLETED'
-            
-            # Log system event for ride completion
-            driver = Employee.query.get(employee_id)
-            log_system_event(
-                event_type='RIDE_COMPLETED',
-                entity_type='ride',
-                description=f'{driver.name if driver else "Driver"} completed ride #{ride.id}',
-                user_id=employee_id,
-                ride_id=ride.id,
-                metadata={'reservations_completed': len(reservations)}
-            )
-            
-            db.session.commit()
-            
-            log_action(
-                action='RIDE_COMPLETED',
-                employee_id=employee_id,
-                details={'ride_id': ride.id, 'new_status': 'completed', 'reservations_completed': len(reservations)}
-            )
-            
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
-            
-            return serialize_ride_with_reservations(ride), 200
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Failed to complete ride: {str(e)}')
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can complete the ride')
+        
+        if not ride.can_transition_to('completed'):
+            api.abort(400, f'Cannot transition from {ride.status} to completed')
+        
+        ride.status = 'completed'
+        
+        # Complete all CONFIRMED reservations in one UPDATE instead of loading
+        # and flushing them one by one
+        reservations_completed = db.session.execute(
+            update(Reservation)
+            .where(Reservation.ride_id == ride.id, Reservation.status == 'CONFIRMED')
+            .values(status='COMPLETED')
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        
+        # Log system event for ride completion
+        driver = db.session.get(Employee, employee_id)
+        log_system_event(
+            event_type='RIDE_COMPLETED',
+            entity_type='ride',
+            description=f'{driver.name if driver else "Driver"} completed ride #{ride.id}',
+            user_id=employee_id,
+            ride_id=ride.id,
+            metadata={'reservations_completed': reservations_completed}
+        )
+        
+        db.session.commit()
+        
+        log_action(
+            action='RIDE_COMPLETED',
+            employee_id=employee_id,
+            details={'ride_id': ride.id, 'new_status': 'completed', 'reservations_completed': reservations_completed}
+        )
+        
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
+        
+        return serialize_ride_with_reservations(ride), 200
 
 
 @api.route('/<int:id>/cancel')
@@ -872,85 +984,78 @@ class RideCancel(Resource):
     )
     def patch(self, id):
         """Cancel a ride (only the driver can cancel)"""
-        employee_id = int(get_jwt_identity())
+        employee_id = current_employee_id()
         
-        try:
-            ride = Ride.query.get(id)
-            
-            if not ride:
-                api.abort(404, 'Ride not found')
-            
-            # Only driver can cancel
-            if ride.driver_id != employee_id:
-                api.abort(403, 'Only the ride driver can cancel it')
-            
-            # Can only cancel ACTIVE or FULL rides
-            if ride.status == 'COMPLETED':
-                api.abort(400, 'Cannot cancel a completed ride')
-            
-            if ride.status == 'CANCELLED':
-                api.abort(400, 'Ride is already cancelled')
-            
-            # Update ride status to CANCELLED
-            ride.status = 'CANCELLED'
-            ride.cancelled_at = datetime.utcnow()
-            
-            short_destination = (ride.destination or '').split(',')[0].strip() or ride.destination
-            
-            # Cancel all PENDING and CONFIRMED reservations for this ride
-            reservations = Reservation.query.filter_by(ride_id=ride.id).filter(
-                Reservation.status.in_(['PENDING', 'CONFIRMED'])
-            ).all()
-            
-            for reservation in reservations:
-                reservation.status = 'CANCELLED'
-                
-                # Create notification for affected passenger
-                notification = Notification(
-                    employee_id=reservation.employee_id,
-                    ride_id=ride.id,
-                    message=f'Ride Cancelled: Your ride to {short_destination} has been cancelled by the driver.',
-                    type='cancellation',
-                    is_read=False
-                )
-                db.session.add(notification)
-            
-            # Log system event for ride cancellation
-            driver = Employee.query.get(employee_id)
-            log_system_event(
-                event_type='RIDE_CANCELLED',
-                entity_type='ride',
-                description=f'{driver.name if driver else "Driver"} cancelled ride #{ride.id}',
-                user_id=employee_id,
-                ride_id=ride.id,
-                metadata={'reservations_cancelled': len(reservations)}
-            )
-            
-            db.session.commit()
-            
-            # Log ride cancellation (console)
-            log_action(
-                action='RIDE_CANCELLED',
-                employee_id=employee_id,
-                details={'ride_id': ride.id, 'origin': ride.origin, 'destination': ride.destination, 'reservations_cancelled': len(reservations)}
-            )
-            
-            # Emit real-time update for ride cancellation
-            emit_ride_status_update(
-                socketio,
-                ride_id=ride.id,
-                new_status=ride.status,
-                updated_at=datetime.utcnow().isoformat()
-            )
-            
-            return serialize_ride_with_reservations(ride), 200
-            
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, 400) without modification
-            raise
-        except Exception as e:
-            db.session.rollback()
-            api.abort(500, f'Cancellation failed: {str(e)}')
+        ride = get_driven_ride(id, employee_id, 'Only the ride driver can cancel it')
+        
+        # Can only cancel ACTIVE or FULL rides
+        if ride.status == 'COMPLETED':
+            api.abort(400, 'Cannot cancel a completed ride')
+        
+        if ride.status == 'CANCELLED':
+            api.abort(400, 'Ride is already cancelled')
+        
+        # Update ride status to CANCELLED
+        ride.status = 'CANCELLED'
+        ride.cancelled_at = datetime.utcnow()
+        
+        short_destination = (ride.destination or '').split(',')[0].strip() or ride.destination
+        
+        # Cancel all PENDING and CONFIRMED reservations for this ride in one
+        # UPDATE, returning the affected passengers to notify
+        passenger_ids = db.session.scalars(
+            update(Reservation)
+            .where(Reservation.ride_id == ride.id, Reservation.status.in_(['PENDING', 'CONFIRMED']))
+            .values(status='CANCELLED')
+            .returning(Reservation.employee_id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        
+        # Notifications for affected passengers go out as one multi-row
+        # INSERT; Core skips the unit of work, so their cached lists are
+        # dropped explicitly after commit
+        if passenger_ids:
+            db.session.execute(insert(Notification), [
+                {
+                    'employee_id': passenger_id,
+                    'ride_id': ride.id,
+                    'message': f'Ride Cancelled: Your ride to {short_destination} has been cancelled by the driver.',
+                    'type': 'cancellation',
+                    'is_read': False
+                }
+                for passenger_id in passenger_ids
+            ])
+        
+        # Log system event for ride cancellation
+        driver = db.session.get(Employee, employee_id)
+        log_system_event(
+            event_type='RIDE_CANCELLED',
+            entity_type='ride',
+            description=f'{driver.name if driver else "Driver"} cancelled ride #{ride.id}',
+            user_id=employee_id,
+            ride_id=ride.id,
+            metadata={'reservations_cancelled': len(passenger_ids)}
+        )
+        
+        db.session.commit()
+        cache.delete(*(notification_list_cache_key(passenger_id) for passenger_id in passenger_ids))
+        
+        # Log ride cancellation (console)
+        log_action(
+            action='RIDE_CANCELLED',
+            employee_id=employee_id,
+            details={'ride_id': ride.id, 'origin': ride.origin, 'destination': ride.destination, 'reservations_cancelled': len(passenger_ids)}
+        )
+        
+        # Emit real-time update for ride cancellation
+        emit_ride_status_update(
+            socketio,
+            ride_id=ride.id,
+            new_status=ride.status,
+            updated_at=datetime.utcnow().isoformat()
+        )
+        
+        return serialize_ride_with_reservations(ride), 200
 
 
 @api.route('/<int:id>/participants')
@@ -965,21 +1070,21 @@ class RideParticipants(Resource):
             500: ('Internal server error', error_response)
         }
     )
-    @api.marshal_with(participant_response)
+    @api.response(200, 'Success', [participant_response])
     def get(self, id):
         """List ride participants (only the driver can access)"""
-        employee_id = int(get_jwt_identity())
-        ride = Ride.query.get(id)
+        employee_id = current_employee_id()
+        driver_id = get_ride_driver_id(id)
         
-        if not ride:
+        if driver_id is None:
             api.abort(404, 'Ride not found')
         
         # Only driver can view participants
-        if ride.driver_id != employee_id:
+        if driver_id != employee_id:
             api.abort(403, 'Only the ride driver can view participants')
         
         # Join Employee, Reservation, and Ride tables to get participants
-        participants = db.session.query(
+        stmt = select(
             Employee.id.label('employee_id'),
             Employee.name,
             Employee.email,
@@ -987,85 +1092,12 @@ class RideParticipants(Resource):
             Reservation.status.label('reservation_status')
         ).join(
             Reservation, Employee.id == Reservation.employee_id
-        ).filter(
+        ).where(
             Reservation.ride_id == id,
             Reservation.status != 'CANCELLED'
-        ).all()
-        
-        return [
-            {
-                'employee_id': p.employee_id,
-                'name': p.name,
-                'email': p.email,
-                'seats_reserved': p.seats_reserved,
-                'reservation_status': p.reservation_status
-            }
-            for p in participants
-        ]
-
-
-# Pending request response model
-pending_request_response = api.model('PendingRequestResponse', {
-    'employee_id': fields.Integer(description='Employee ID'),
-    'name': fields.String(description='Employee name'),
-    'email': fields.String(description='Employee email'),
-    'seats_requested': fields.Integer(description='Seats requested'),
-    'status': fields.String(description='Request status (PENDING)'),
-    'requested_at': fields.DateTime(description='Request timestamp')
-})
-
-
-@api.route('/<int:id>/pending-requests')
-@api.param('id', 'Ride ID')
-class RidePendingRequests(Resource):
-    @jwt_required()
-    @api.doc('list_pending_requests', security='Bearer', description='Get list of pending reservation requests for a ride (driver only)',
-        responses={
-            401: ('Unauthorized - JWT required', error_response),
-            403: ('Forbidden - Only ride driver can view pending requests', error_response),
-            404: ('Ride not found', error_response),
-            500: ('Internal server error', error_response)
-        }
-    )
-    @api.marshal_with(pending_request_response)
-    def get(self, id):
-        """List pending reservation requests (only the driver can access)"""
-        employee_id = int(get_jwt_identity())
-        ride = Ride.query.get(id)
-        
-        if not ride:
-            api.abort(404, 'Ride not found')
-        
-        # Only driver can view pending requests
-        if ride.driver_id != employee_id:
-            api.abort(403, 'Only the ride driver can view pending requests')
-        
-        # Join Employee, Reservation, and Ride tables to get pending requests
-        pending_requests = db.session.query(
-            Employee.id.label('employee_id'),
-            Employee.name,
-            Employee.email,
-            Reservation.seats_reserved.label('seats_requested'),
-            Reservation.status.label('status'),
-            Reservation.created_at.label('requested_at')
-        ).join(
-            Reservation, Employee.id == Reservation.employee_id
-        ).filter(
-            Reservation.ride_id == id,
-            Reservation.status == 'PENDING'
-        ).all()
-        
-        return [
-            {
-                'employee_id': pr.employee_id,
-                'name': pr.name,
-                'email': pr.email,
-                'seats_requested': pr.seats_requested,
-                'status': pr.status,
-                'requested_at': pr.requested_at.isoformat() if pr.requested_at else None
-            }
-            for pr in pending_requests
-        ]
+        )
+        # Rows are already in response shape; skip marshalling
+        return [dict(row) for row in db.session.execute(stmt).mappings()]
 
 
 # Pending request response model
@@ -1094,14 +1126,14 @@ class RidePendingRequests(Resource):
     @api.marshal_with(pending_request_response)
     def get(self, id):
         """List pending reservation requests (only the driver can access)"""
-        employee_id = int(get_jwt_identity())
-        ride = Ride.query.get(id)
+        employee_id = current_employee_id()
+        driver_id = get_ride_driver_id(id)
         
-        if not ride:
+        if driver_id is None:
             api.abort(404, 'Ride not found')
         
         # Only driver can view pending requests
-        if ride.driver_id != employee_id:
+        if driver_id != employee_id:
             api.abort(403, 'Only the ride driver can view pending requests')
         
         # Join Employee, Reservation, and Ride tables to get pending requests
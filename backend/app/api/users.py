@@ -1,9 +1,9 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 
-from app.extensions import db
-from app.models import Employee
+from app.api import current_employee_id
+from app.api.auth import get_employee_profile, update_employee_profile
 
 api = Namespace('users', description='User profile operations')
 
@@ -50,14 +50,12 @@ class UserProfile(Resource):
     @api.marshal_with(user_profile_response)
     def get(self):
         """Get current user profile with carpool stats"""
-        employee_id = int(get_jwt_identity())
-        employee = Employee.query.get(employee_id)
+        profile = get_employee_profile(current_employee_id())
         
-        if not employee:
+        if not profile:
             api.abort(404, 'User not found')
         
-        # Return employee dict with stats
-        return employee.to_dict(include_stats=True)
+        return profile
 
     @jwt_required()
     @api.doc('update_user_profile', security='Bearer', description='Update current user profile',
@@ -72,25 +70,13 @@ class UserProfile(Resource):
     @api.marshal_with(user_profile_response)
     def patch(self):
         """Update current user profile (phone, car details)"""
-        employee_id = int(get_jwt_identity())
-        employee = Employee.query.get(employee_id)
-        
-        if not employee:
-            api.abort(404, 'User not found')
-        
         data = request.get_json() or {}
         
-        # Update allowed fields
-        if 'phone_number' in data:
-            employee.phone_number = data['phone_number']
-        if 'car_model' in data:
-            employee.car_model = data['car_model']
-        if 'car_plate' in data:
-            employee.car_plate = data['car_plate']
-        if 'car_color' in data:
-            employee.car_color = data['car_color']
+        # Only the allowed profile fields are written
+        profile = update_employee_profile(current_employee_id(), data)
         
-        db.session.commit()
+        if not profile:
+            api.abort(404, 'User not found')
         
         # Return updated profile with stats
-        return employee.to_dict(include_stats=True)
+        return profile
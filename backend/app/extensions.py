@@ -1,3 +1,6 @@
+import logging
+from types import MappingProxyType
+
 from flask import jsonify
 from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
@@ -5,8 +8,11 @@ from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_jwt_extended.exceptions import NoAuthorizationError
 from flask_socketio import SocketIO
+from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import HTTPException
 
+from app.utils.cache import ResponseCache
+
 authorizations = {
     'Bearer': {
         'type': 'apiKey',
@@ -16,56 +22,73 @@ authorizations = {
     }
 }
 
-# Error code mapping
-ERROR_CODES = {
+# Error code mapping (single source for all error responses; read-only)
+ERROR_CODES = MappingProxyType({
     400: 'VALIDATION_ERROR',
     401: 'UNAUTHORIZED',
     403: 'FORBIDDEN',
     404: 'NOT_FOUND',
     409: 'CONFLICT',
     500: 'INTERNAL_ERROR'
-}
+})
+
+logger = logging.getLogger(__name__)
+
+# Bound once; looked up on every error response
+_error_code = ERROR_CODES.get
+
 
 def configure_error_handlers(api):
     """Configure Flask-RESTX error handlers for standardized responses."""
+    # The Api is process-wide; wrapping it again for every app created would
+    # stack one more handler layer per create_app() call
+    if getattr(api, '_standard_errors_configured', False):
+        return
     
     # Store original error handler
     original_handle_error = api.handle_error
     
     def custom_handle_error(error):
         """Custom error handler that returns standardized format."""
+        # Most errors are api.abort() calls; handle them before the JWT checks
+        # (werkzeug HTTPExceptions carry no status_code, so the order is safe)
+        if isinstance(error, HTTPException):
+            return {'error': _error_code(error.code, 'INTERNAL_ERROR'), 'message': error.description}, error.code
+        
         # Check if it's a NoAuthorizationError from Flask-JWT-Extended
         if isinstance(error, NoAuthorizationError):
             return {'error': 'UNAUTHORIZED', 'message': 'Missing Authorization Header'}, 401
         
         # Check if it's a JWT-related error (has status_code from Flask-JWT-Extended)
-        if hasattr(error, 'status_code') and error.status_code == 401:
+        status_code = getattr(error, 'status_code', None)
+        if status_code == 401:
             message = str(getattr(error, 'message', 'Authentication required'))
             return {'error': 'UNAUTHORIZED', 'message': message}, 401
         
-        # Get error code from HTTPException
-        if isinstance(error, HTTPException):
-            code = error.code
-            message = error.description
-        elif hasattr(error, 'code'):
+        # Database failures: discard the failed transaction without leaking SQL details
+        if isinstance(error, SQLAlchemyError):
+            db.session.rollback()
+            logger.error(f'Database error: {error}', exc_info=True)
+            return {'error': 'INTERNAL_ERROR', 'message': 'Database error'}, 500
+        
+        # Get error code from other exceptions carrying one
+        if hasattr(error, 'code'):
             code = error.code
             message = str(getattr(error, 'description', str(error)))
-        elif hasattr(error, 'status_code'):
+        elif status_code is not None:
             # Handle Flask-JWT-Extended errors
-            code = error.status_code
+            code = status_code
             message = str(getattr(error, 'message', str(error)))
         else:
             # Fall back to original handler for non-HTTP exceptions
             return original_handle_error(error)
         
-        # Map to standardized error code
-        error_code = ERROR_CODES.get(int(code), 'INTERNAL_ERROR')
-        
         # Return standardized response
-        return {'error': error_code, 'message': message}, code
+        return {'error': _error_code(int(code), 'INTERNAL_ERROR'), 'message': message}, code
     
     # Replace the API's handle_error method
     api.handle_error = custom_handle_error
+    api._standard_errors_configured = True
 
 api = Api(
     title="Gexpertise Smart Carpooling API",
@@ -78,6 +101,7 @@ api = Api(
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
+cache = ResponseCache()
 socketio = SocketIO(
     cors_allowed_origins="*",
     async_mode='threading',
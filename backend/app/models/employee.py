@@ -1,6 +1,17 @@
+from functools import lru_cache
+
+from flask import current_app
 from app.extensions import db
 from werkzeug.security import generate_password_hash, check_password_hash
 
+
+@lru_cache(maxsize=None)
+def _hash_method_prefix(method):
+    """Method spec werkzeug stores for method, with defaults expanded
+    ('scrypt' -> 'scrypt:32768:8:1')."""
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+
 class Employee(db.Model):
     __tablename__ = 'employees'
 
@@ -28,12 +39,19 @@ class Employee(db.Model):
 
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(
+            password, method=current_app.config['PASSWORD_HASH_METHOD']
+        )
 
     def check_password(self, password):
         """Verify password against hash"""
         return check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self):
+        """Whether the stored hash uses a different method than PASSWORD_HASH_METHOD"""
+        configured = _hash_method_prefix(current_app.config['PASSWORD_HASH_METHOD'])
+        return self.password_hash.split('$', 1)[0] != configured
+
     def to_dict(self, include_stats=False):
         """Convert employee to dictionary"""
         data = {
@@ -52,8 +70,8 @@ class Employee(db.Model):
         }
         
         if include_stats:
-            data['rides_offered_count'] = self.offered_rides.count()
-            data['bookings_count'] = self.reservations.count()
+            data['rides_offered_count'] = self.rides_offered_count
+            data['bookings_count'] = self.bookings_count
         
         return data
 
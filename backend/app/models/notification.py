@@ -15,6 +15,12 @@ class Notification(db.Model):
     employee = db.relationship('Employee', back_populates='notifications')
     ride = db.relationship('Ride', back_populates='notifications')
 
+    __table_args__ = (
+        # Matches the list ordering (created_at, id) so both the full list and
+        # keyset pages are read straight off the index without a sort
+        db.Index('ix_notifications_employee_created_id', employee_id, created_at.desc(), id.desc()),
+    )
+
     def to_dict(self):
         """Convert notification to dictionary"""
         return {
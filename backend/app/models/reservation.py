@@ -1,4 +1,6 @@
 from app.extensions import db
+from app.models.employee import Employee
+from app.models.ride import Ride
 
 class Reservation(db.Model):
     __tablename__ = 'reservations'
@@ -17,6 +19,25 @@ class Reservation(db.Model):
     employee = db.relationship('Employee', back_populates='reservations')
     ride = db.relationship('Ride', back_populates='reservations')
 
+    __table_args__ = (
+        db.Index('ix_reservations_employee_created', employee_id, created_at.desc()),
+        db.Index('ix_reservations_ride_status', ride_id, status),
+        # Covers SUM(seats_reserved) over a ride's confirmed reservations
+        # (Ride.reserved_seats) as an index-only scan
+        db.Index(
+            'ix_reservations_ride_confirmed_seats', ride_id, seats_reserved,
+            postgresql_where=db.text("status = 'CONFIRMED'"),
+            sqlite_where=db.text("status = 'CONFIRMED'")
+        ),
+        # At most one active (PENDING/CONFIRMED) reservation per employee and ride;
+        # enforced by the database so booking needs no SELECT-then-INSERT check
+        db.Index(
+            'uq_reservations_active', employee_id, ride_id, unique=True,
+            postgresql_where=db.text("status IN ('PENDING', 'CONFIRMED')"),
+            sqlite_where=db.text("status IN ('PENDING', 'CONFIRMED')")
+        ),
+    )
+
     # Valid reservation statuses
     VALID_STATUSES = ['PENDING', 'CONFIRMED', 'CANCELLED', 'REJECTED', 'MISSED']
     
@@ -25,3 +46,37 @@ class Reservation(db.Model):
 
     def __repr__(self):
         return f'<Reservation {self.seats_reserved} seats on Ride {self.ride_id}>'
+
+
+# Seats held by CONFIRMED reservations, computed by a correlated subquery so it
+# cannot drift from the reservations table (status changes also go through
+# Core UPDATEs that bypass ORM events). Deferred: only loaded where a caller
+# undefers it in the ride SELECT, or on first access.
+Ride.reserved_seats = db.column_property(
+    db.select(db.func.coalesce(db.func.sum(Reservation.seats_reserved), 0))
+    .where(Reservation.ride_id == Ride.id, Reservation.status == 'CONFIRMED')
+    .correlate_except(Reservation)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
+# Profile stats, computed the same way: correlated COUNTs served by the
+# driver_id / employee_id leading indexes. Deferred as one group so they load
+# together, and only for the profile views that show them.
+Employee.rides_offered_count = db.column_property(
+    db.select(db.func.count(Ride.id))
+    .where(Ride.driver_id == Employee.id)
+    .correlate_except(Ride)
+    .scalar_subquery(),
+    deferred=True,
+    group='stats'
+)
+Employee.bookings_count = db.column_property(
+    db.select(db.func.count(Reservation.id))
+    .where(Reservation.employee_id == Employee.id)
+    .correlate_except(Reservation)
+    .scalar_subquery(),
+    deferred=True,
+    group='stats'
+)
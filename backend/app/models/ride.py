@@ -23,11 +23,36 @@ class Ride(db.Model):
     is_deleted = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+    # Optimistic concurrency: ORM updates check and bump this counter
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # Relationships
     driver = db.relationship('Employee', back_populates='offered_rides')
-    reservations = db.relationship('Reservation', back_populates='ride', lazy='dynamic')
-    notifications = db.relationship('Notification', back_populates='ride', lazy='dynamic')
+    reservations = db.relationship('Reservation', back_populates='ride')
+    notifications = db.relationship('Notification', back_populates='ride')
+
+    __table_args__ = (
+        db.Index('ix_rides_driver_departure', driver_id, departure_time.desc()),
+        db.Index('ix_rides_status_seats', status, available_seats),
+        # Expiration sweep: scheduled rides whose departure time has passed
+        db.Index('ix_rides_status_departure', status, departure_time),
+        # Ride list ordering and its keyset cursor (departure_time, id)
+        db.Index('ix_rides_departure_id', departure_time, id),
+        # Bounding-box prefilter of coordinate search (latitude range, then longitude)
+        db.Index('ix_rides_origin_coords', origin_lat, origin_lng),
+        db.Index('ix_rides_destination_coords', destination_lat, destination_lng),
+        # Trigram indexes serve the '%term%' ILIKE searches on origin/destination
+        # (PostgreSQL only; needs the pg_trgm extension created below)
+        db.Index(
+            'ix_rides_origin_trgm', origin,
+            postgresql_using='gin', postgresql_ops={'origin': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+        db.Index(
+            'ix_rides_destination_trgm', destination,
+            postgresql_using='gin', postgresql_ops={'destination': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+    __mapper_args__ = {'version_id_col': version}
 
     # Valid status values
     VALID_STATUSES = [
@@ -67,3 +92,9 @@ class Ride(db.Model):
 
     def __repr__(self):
         return f'<Ride {self.origin} to {self.destination} ({self.status})>'
+
+
+db.event.listen(
+    Ride.__table__, 'before_create',
+    db.DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
@@ -46,32 +46,39 @@ def register_socket_handlers(socketio):
     def _auto_join_ride_rooms(user_id):
         """Auto-join user to rooms for their active rides (as driver or confirmed passenger)."""
         try:
+            from app.extensions import db
             from app.models import Ride, Reservation
             
             # Rides where user is driver
-            driver_rides = Ride.query.filter(
-                Ride.driver_id == user_id,
-                Ride.status.in_(ACTIVE_RIDE_STATUSES),
-                Ride.is_deleted == False
+            driver_ride_ids = db.session.scalars(
+                db.select(Ride.id).where(
+                    Ride.driver_id == user_id,
+                    Ride.status.in_(ACTIVE_RIDE_STATUSES),
+                    Ride.is_deleted == False
+                )
             ).all()
             
-            for ride in driver_rides:
-                room = f'ride_{ride.id}'
+            for ride_id in driver_ride_ids:
+                room = f'ride_{ride_id}'
                 join_room(room)
                 logger.info(f'Auto-joined user {user_id} (driver) to room {room}')
             
-            # Rides where user is confirmed passenger
-            confirmed_reservations = Reservation.query.filter(
-                Reservation.employee_id == user_id,
-                Reservation.status == 'CONFIRMED'
+            # Rides where user is confirmed passenger, filtered in the same query
+            passenger_ride_ids = db.session.scalars(
+                db.select(Ride.id).join(
+                    Reservation, Reservation.ride_id == Ride.id
+                ).where(
+                    Reservation.employee_id == user_id,
+                    Reservation.status == 'CONFIRMED',
+                    Ride.status.in_(ACTIVE_RIDE_STATUSES),
+                    Ride.is_deleted == False
+                )
             ).all()
             
-            for reservation in confirmed_reservations:
-                ride = Ride.query.get(reservation.ride_id)
-                if ride and ride.status in ACTIVE_RIDE_STATUSES and not ride.is_deleted:
-                    room = f'ride_{ride.id}'
-                    join_room(room)
-                    logger.info(f'Auto-joined user {user_id} (passenger) to room {room}')
+            for ride_id in passenger_ride_ids:
+                room = f'ride_{ride_id}'
+                join_room(room)
+                logger.info(f'Auto-joined user {user_id} (passenger) to room {room}')
                     
         except Exception as e:
             logger.error(f'Error auto-joining ride rooms for user {user_id}: {e}')
@@ -182,8 +189,9 @@ def register_socket_handlers(socketio):
                 return
             
             # Validate ride exists
+            from app.extensions import db
             from app.models import Ride
-            ride = Ride.query.get(ride_id)
+            ride = db.session.get(Ride, ride_id)
             
             if not ride:
                 logger.warning(f'Location update for non-existent ride {ride_id}')
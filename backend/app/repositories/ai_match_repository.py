@@ -69,7 +69,7 @@ class AIMatchRepository:
         Returns:
             AIMatch or None if not found
         """
-        return AIMatch.query.get(match_id)
+        return db.session.get(AIMatch, match_id)
 
     @staticmethod
     def get_matches_for_passenger(passenger_request_id, status=None):
@@ -139,7 +139,7 @@ class AIMatchRepository:
             AIMatch: Updated match object or None if not found
         """
         try:
-            match = AIMatch.query.get(match_id)
+            match = db.session.get(AIMatch, match_id)
             if match:
                 match.update_status(new_status)
                 db.session.commit()
@@ -198,7 +198,7 @@ class AIMatchRepository:
             bool: True if deleted, False if not found
         """
         try:
-            match = AIMatch.query.get(match_id)
+            match = db.session.get(AIMatch, match_id)
             if match:
                 db.session.delete(match)
                 db.session.commit()
@@ -144,7 +144,7 @@ class PassengerRequestRepository:
         Returns:
             PassengerRequest: The request object or None if not found
         """
-        return PassengerRequest.query.get(request_id)
+        return db.session.get(PassengerRequest, request_id)
 
     @staticmethod
     def mark_as_matched(request_id):
@@ -158,7 +158,7 @@ class PassengerRequestRepository:
             PassengerRequest: The updated request object or None if not found
         """
         try:
-            request = PassengerRequest.query.get(request_id)
+            request = db.session.get(PassengerRequest, request_id)
             if request:
                 request.mark_as_matched()
                 db.session.commit()
@@ -179,7 +179,7 @@ class PassengerRequestRepository:
             bool: True if deleted, False if not found
         """
         try:
-            request = PassengerRequest.query.get(request_id)
+            request = db.session.get(PassengerRequest, request_id)
             if request:
                 db.session.delete(request)
                 db.session.commit()
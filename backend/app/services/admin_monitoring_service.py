@@ -12,7 +12,7 @@ def update_last_seen(employee_id):
     Call this whenever an employee makes an API request to track activity.
     """
     try:
-        employee = Employee.query.get(employee_id)
+        employee = db.session.get(Employee, employee_id)
         if employee:
             employee.last_seen_at = datetime.utcnow()
             db.session.commit()
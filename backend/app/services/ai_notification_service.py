@@ -43,7 +43,7 @@ class AINotificationService:
         """
         try:
             # Get passenger request to find the user
-            passenger_request = PassengerRequest.query.get(ai_match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, ai_match.passenger_request_id)
             if not passenger_request:
                 logger.error(f"Passenger request {ai_match.passenger_request_id} not found for match {ai_match.id}")
                 return None
@@ -108,13 +108,13 @@ class AINotificationService:
         try:
             # Get the ride to find the driver
             from app.models import Ride
-            ride = Ride.query.get(ai_match.ride_id)
+            ride = db.session.get(Ride, ai_match.ride_id)
             if not ride:
                 logger.error(f"Ride {ai_match.ride_id} not found for match {ai_match.id}")
                 return None
             
             # Get passenger request for additional context
-            passenger_request = PassengerRequest.query.get(ai_match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, ai_match.passenger_request_id)
             if not passenger_request:
                 logger.error(f"Passenger request {ai_match.passenger_request_id} not found for match {ai_match.id}")
                 return None
@@ -179,7 +179,7 @@ class AINotificationService:
         """
         try:
             # Get passenger request to find the user
-            passenger_request = PassengerRequest.query.get(ai_match.passenger_request_id)
+            passenger_request = db.session.get(PassengerRequest, ai_match.passenger_request_id)
             if not passenger_request:
                 logger.error(f"Passenger request {ai_match.passenger_request_id} not found for match {ai_match.id}")
                 return None
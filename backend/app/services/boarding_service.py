@@ -69,7 +69,7 @@ def confirm_boarding(reservation_id, employee_id):
         tuple: (success: bool, message: str)
     """
     try:
-        reservation = Reservation.query.get(reservation_id)
+        reservation = db.session.get(Reservation, reservation_id)
         
         if not reservation:
             return False, 'Reservation not found'
@@ -208,7 +208,7 @@ def _send_driver_boarding_confirmed_notification(reservation):
     """Send notification to driver that a passenger confirmed boarding."""
     from app.models.employee import Employee
     ride = reservation.ride
-    passenger = Employee.query.get(reservation.employee_id)
+    passenger = db.session.get(Employee, reservation.employee_id)
     passenger_name = passenger.name if passenger else 'Passenger'
     
     notification = Notification(
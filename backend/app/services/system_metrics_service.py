@@ -5,7 +5,7 @@ the admin dashboard and analytics endpoints to ensure consistent data.
 """
 
 from datetime import datetime, timedelta
-from sqlalchemy import func, cast, Date
+from sqlalchemy import func, cast, Date, case, select
 from app import db
 from app.models.employee import Employee
 from app.models.ride import Ride
@@ -56,6 +56,42 @@ def get_total_reservations():
     )
 
 
+def get_platform_totals():
+    """Get user, ride and reservation totals in a single round-trip.
+
+    Ride totals come from one conditional aggregate over the rides table;
+    users and reservations are folded in as scalar subqueries.
+
+    Returns:
+        dict: Contains total_users, total_rides, active_rides, total_reservations
+    """
+    ride_totals = select(
+        func.count(Ride.id).label('total_rides'),
+        func.coalesce(
+            func.sum(case((Ride.status.in_(['ACTIVE', 'FULL']), 1), else_=0)), 0
+        ).label('active_rides')
+    ).subquery()
+
+    total_users = select(func.count(Employee.id)).scalar_subquery()
+    total_reservations = (
+        select(func.count(Reservation.id))
+        .where(Reservation.status != 'CANCELLED')
+        .scalar_subquery()
+    )
+
+    row = db.session.execute(
+        select(
+            total_users.label('total_users'),
+            ride_totals.c.total_rides,
+            ride_totals.c.active_rides,
+            total_reservations.label('total_reservations')
+        ).select_from(ride_totals)
+    ).one()
+
+    # COUNT/COALESCE never yield NULL, so the row is already in final form
+    return dict(row._mapping)
+
+
 def get_system_status():
     """Get system operational status."""
     return 'operational'
@@ -67,11 +103,12 @@ def get_dashboard_metrics():
     Returns:
         dict: Contains all dashboard metrics
     """
+    totals = get_platform_totals()
     return {
-        'users_total': get_total_users(),
+        'users_total': totals['total_users'],
         'users_today': get_users_today(),
-        'active_rides': get_active_rides(),
-        'rides_total': get_total_rides(),
-        'reservations_total': get_total_reservations(),
+        'active_rides': totals['active_rides'],
+        'rides_total': totals['total_rides'],
+        'reservations_total': totals['total_reservations'],
         'system_status': get_system_status()
     }
@@ -0,0 +1,159 @@
+"""Shared response cache backed by Redis, with an in-process fallback.
+
+Redis is used when ``REDIS_URL`` is configured and the ``redis`` package is
+installed. Otherwise values are kept in a per-process dictionary, which keeps
+development and tests working without a Redis server.
+"""
+import logging
+import threading
+import time
+from functools import wraps
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional outside production
+    redis = None
+
+# Session.info key holding cache keys to drop once the transaction commits
+_PENDING_KEYS = '_cache_pending_invalidations'
+
+# Version token embedded in every cached ride list page; deleting it makes
+# all pages stale at once
+RIDE_LIST_VERSION_KEY = 'ride_list:version'
+
+# Seconds between sweeps of expired in-process entries. Keys that are never
+# read again (such as pages under a dropped version) are only freed by a sweep
+LOCAL_SWEEP_INTERVAL = 60
+
+
+class _LocalBackend:
+    """Thread-safe in-process key/value store with per-key expiry."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + LOCAL_SWEEP_INTERVAL
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def setex(self, key, ttl, value):
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._next_sweep:
+                self._data = {k: entry for k, entry in self._data.items() if entry[1] > now}
+                self._next_sweep = now + LOCAL_SWEEP_INTERVAL
+            self._data[key] = (value, now + ttl)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+
+class ResponseCache:
+    """JSON value cache with TTLs and commit-driven invalidation.
+
+    Values are encoded with orjson, the same encoder used for API responses.
+
+    Cache failures are logged and treated as misses so that an unavailable
+    Redis server never breaks a request.
+    """
+
+    def __init__(self, app=None):
+        self._backend = _LocalBackend()
+        event.listen(Session, 'after_commit', self._flush_pending_invalidations)
+        event.listen(Session, 'after_rollback', self._discard_pending_invalidations)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Select the backend from the app configuration."""
+        redis_url = app.config.get('REDIS_URL')
+        if redis_url and redis is not None:
+            self._backend = redis.Redis.from_url(redis_url)
+        else:
+            if redis_url:
+                logger.warning('REDIS_URL is set but redis is not installed; using in-process cache')
+            self._backend = _LocalBackend()
+        app.extensions['response_cache'] = self
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        try:
+            raw = self._backend.get(key)
+        except Exception as e:
+            logger.warning(f'Cache get failed for {key}: {e}')
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl):
+        """Store a JSON-serializable value for ttl seconds."""
+        try:
+            self._backend.setex(key, ttl, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+        except Exception as e:
+            logger.warning(f'Cache set failed for {key}: {e}')
+
+    def delete(self, *keys):
+        """Drop one or more keys."""
+        if not keys:
+            return
+        try:
+            self._backend.delete(*keys)
+        except Exception as e:
+            logger.warning(f'Cache delete failed for {keys}: {e}')
+
+    def cached(self, key, ttl):
+        """Decorator caching a function's JSON-serializable result under key."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                value = self.get(key)
+                if value is None:
+                    value = func(*args, **kwargs)
+                    self.set(key, value, ttl)
+                return value
+            return wrapper
+        return decorator
+
+    def invalidate_on(self, models, *keys, events=('insert', 'update', 'delete')):
+        """Drop keys after any commit that inserts, updates or deletes models.
+
+        Each key is either a string or a callable receiving the changed
+        instance and returning its key (for per-owner entries). Keys are
+        collected while the session flushes and only deleted once the
+        transaction commits, so readers never repopulate the cache from
+        uncommitted state. events narrows which kinds of change count.
+        """
+        def mark(mapper, connection, target):
+            session = object_session(target)
+            if session is not None:
+                session.info.setdefault(_PENDING_KEYS, set()).update(
+                    key(target) if callable(key) else key for key in keys
+                )
+
+        for model in models:
+            for event_name in events:
+                event.listen(model, f'after_{event_name}', mark)
+
+    def _flush_pending_invalidations(self, session):
+        pending = session.info.pop(_PENDING_KEYS, None)
+        if pending:
+            self.delete(*pending)
+
+    def _discard_pending_invalidations(self, session):
+        session.info.pop(_PENDING_KEYS, None)
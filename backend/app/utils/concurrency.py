@@ -0,0 +1,30 @@
+"""Helpers for optimistic concurrency control on versioned models."""
+from functools import wraps
+
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.extensions import db
+
+DEFAULT_CONFLICT_ATTEMPTS = 3
+
+
+def retry_on_conflict(attempts=DEFAULT_CONFLICT_ATTEMPTS):
+    """Re-run a handler when its commit hits a concurrent versioned update.
+
+    Versioned rows (e.g. Ride) raise StaleDataError when another transaction
+    updated them after they were loaded. The session is rolled back and the
+    handler re-runs from scratch, re-reading and re-validating current state.
+    The final attempt's error propagates.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except StaleDataError:
+                    db.session.rollback()
+                    if attempt == attempts:
+                        raise
+        return wrapper
+    return decorator
@@ -0,0 +1,19 @@
+"""ISO 8601 parsing for request payloads."""
+from datetime import timezone
+
+from ciso8601 import parse_datetime
+
+
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 string into a naive UTC datetime.
+
+    Uses ciso8601's C parser. Timestamps with an offset (including 'Z') are
+    converted to UTC, matching the naive UTC datetimes stored in the database.
+    Raises ValueError for malformed input.
+    """
+    if not isinstance(value, str):
+        raise ValueError('datetime must be an ISO 8601 string')
+    parsed = parse_datetime(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
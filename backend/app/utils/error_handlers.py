@@ -5,15 +5,6 @@ from werkzeug.exceptions import BadRequest, NotFound, Unauthorized, Forbidden, I
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from app.utils.logger import log_action
 
-# Error code mapping
-ERROR_CODES = {
-    400: 'VALIDATION_ERROR',
-    401: 'UNAUTHORIZED',
-    403: 'FORBIDDEN',
-    404: 'NOT_FOUND',
-    500: 'INTERNAL_ERROR'
-}
-
 def make_error_response(error_code, message, status_code):
     """Create standardized error response."""
     response = jsonify({
@@ -48,6 +48,37 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     return distance
 
 
+def bounding_box(lat, lon, radius_km):
+    """
+    Return a lat/lon box that contains every point within radius_km of a point.
+    
+    Used to pre-filter candidates in SQL before the exact haversine check. The
+    box is slightly larger than the circle (111 km per degree is rounded down).
+    
+    Args:
+        lat, lon: Centre point (in decimal degrees)
+        radius_km: Radius in kilometers
+        
+    Returns:
+        (min_lat, max_lat, min_lon, max_lon); the longitude bounds are None when
+        the box crosses a pole or the antimeridian and cannot be expressed as
+        a simple range
+    """
+    dlat = radius_km / 111.0
+    min_lat, max_lat = lat - dlat, lat + dlat
+    
+    # Longitude degrees shrink with latitude; use the edge nearest the pole
+    widest_lat = min(max(abs(min_lat), abs(max_lat)), 90.0)
+    cos_lat = math.cos(math.radians(widest_lat))
+    if cos_lat <= 0:
+        return min_lat, max_lat, None, None
+    dlon = radius_km / (111.0 * cos_lat)
+    min_lon, max_lon = lon - dlon, lon + dlon
+    if min_lon < -180.0 or max_lon > 180.0:
+        return min_lat, max_lat, None, None
+    return min_lat, max_lat, min_lon, max_lon
+
+
 def is_within_radius(point1_lat, point1_lon, point2_lat, point2_lon, radius_km):
     """
     Check if two points are within a specified radius.
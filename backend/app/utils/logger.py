@@ -1,5 +1,8 @@
 """Centralized structured logging utility for the carpooling platform."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -36,9 +39,16 @@ def setup_logger(name: str = "carpooling") -> logging.Logger:
     
     handler.setFormatter(StructuredFormatter())
     
+    # Request threads only enqueue records; a background listener thread
+    # formats and writes them, keeping stdout I/O off the request path
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Remove existing handlers and add our handler
     logger.handlers = []
-    logger.addHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logger
 
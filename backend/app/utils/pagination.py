@@ -0,0 +1,38 @@
+"""Query-string pagination helpers for list endpoints."""
+from flask import request
+from flask_restx import abort
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+
+
+def get_page_args(max_per_page=MAX_PER_PAGE):
+    """Read page/per_page from the query string.
+
+    Pagination is opt-in so existing clients keep receiving full lists:
+    returns None when neither parameter is present, otherwise a validated
+    (page, per_page) tuple. Invalid values abort with 400.
+    """
+    if 'page' not in request.args and 'per_page' not in request.args:
+        return None
+
+    try:
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', DEFAULT_PER_PAGE))
+    except ValueError:
+        abort(400, 'page and per_page must be integers')
+
+    if page < 1:
+        abort(400, 'page must be >= 1')
+    if per_page < 1 or per_page > max_per_page:
+        abort(400, f'per_page must be between 1 and {max_per_page}')
+
+    return page, per_page
+
+
+def paginate(stmt, page_args):
+    """Apply LIMIT/OFFSET for page_args to a select (no-op when None)."""
+    if page_args is None:
+        return stmt
+    page, per_page = page_args
+    return stmt.limit(per_page).offset((page - 1) * per_page)
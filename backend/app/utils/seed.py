@@ -1,3 +1,5 @@
+from sqlalchemy import insert
+
 from app.extensions import db
 from app.models import Employee, Ride
 
@@ -40,11 +42,9 @@ def seed_demo_data():
         db.session.commit()
         return
 
-    for ride_data in DEMO_RIDES:
-        ride = Ride(
-            driver_id=driver.id,
-            departure_time=db.func.now(),
-            **ride_data
-        )
-        db.session.add(ride)
+    # One executemany INSERT instead of a unit-of-work flush per ride
+    db.session.execute(
+        insert(Ride).values(driver_id=driver.id, departure_time=db.func.now()),
+        DEMO_RIDES
+    )
     db.session.commit()
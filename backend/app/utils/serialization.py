@@ -0,0 +1,55 @@
+"""orjson-backed JSON encoding for Flask and Flask-RESTX responses."""
+from itertools import islice
+
+import orjson
+from flask import current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+
+
+def _dump_options(settings):
+    """Translate json.dumps-style keyword arguments into orjson option flags."""
+    option = orjson.OPT_NON_STR_KEYS
+    if settings.get('indent'):
+        option |= orjson.OPT_INDENT_2
+    if settings.get('sort_keys'):
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider using orjson (used by jsonify and request.get_json)."""
+
+    def dumps(self, obj, **kwargs):
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return orjson.dumps(obj, default=self.default, option=_dump_options(kwargs)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX representation for application/json, encoded with orjson."""
+    settings = dict(current_app.config.get('RESTX_JSON', {}))
+    if current_app.debug:
+        settings.setdefault('indent', 4)
+
+    dumped = orjson.dumps(data, default=current_app.json.default, option=_dump_options(settings)) + b'\n'
+
+    resp = make_response(dumped, code)
+    resp.headers.extend(headers or {})
+    return resp
+
+
+def stream_json_array(rows, batch_size):
+    """Yield rows as a JSON array, encoding batch_size items per chunk.
+
+    Used with stream_with_context so large lists are sent while the cursor
+    is still being read instead of being built in memory first.
+    """
+    rows = iter(rows)
+    separator = b''
+    yield b'['
+    while batch := list(islice(rows, batch_size)):
+        yield separator + orjson.dumps(batch, default=current_app.json.default)[1:-1]
+        separator = b','
+    yield b']\n'
@@ -0,0 +1,37 @@
+"""Dialect-aware SQL expressions shared by the API queries."""
+from sqlalchemy import String
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class iso_timestamp(FunctionElement):
+    """Render a timestamp column as an ISO 8601 string.
+
+    Matches datetime.isoformat() (and so orjson and fields.DateTime): six
+    fractional digits when the value has microseconds, none otherwise. Lets
+    the database format datetimes in the SELECT list so rows can be returned
+    without a per-row isoformat() in Python.
+    """
+    type = String()
+    inherit_cache = True
+
+
+@compiles(iso_timestamp)
+def _compile_iso_timestamp(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return (
+        "CASE WHEN to_char({0}, 'US') = '000000' "
+        "THEN to_char({0}, 'YYYY-MM-DD\"T\"HH24:MI:SS') "
+        "ELSE to_char({0}, 'YYYY-MM-DD\"T\"HH24:MI:SS.US') END"
+    ).format(value)
+
+
+@compiles(iso_timestamp, 'sqlite')
+def _compile_iso_timestamp_sqlite(element, compiler, **kw):
+    # SQLite keeps datetimes as 'YYYY-MM-DD HH:MM:SS[.ffffff]' text, and its
+    # strftime() only has millisecond precision, so reshape the stored text
+    value = compiler.process(element.clauses, **kw)
+    return (
+        "replace(CASE WHEN substr({0}, 20) IN ('', '.000000') "
+        "THEN substr({0}, 1, 19) ELSE {0} END, ' ', 'T')"
+    ).format(value)
@@ -27,30 +27,28 @@ def migrate():
         print("MIGRATION: Update Notifications Table")
         print("=" * 60)
         
-        # Check which columns already exist
-        with db.engine.connect() as conn:
+        # Run every step on one connection and commit once at the end, so the
+        # table rebuild either fully applies or leaves the old table intact
+        with db.engine.begin() as conn:
+            # Check which columns already exist
             result = conn.execute(db.text("PRAGMA table_info(notifications)"))
             columns = {row[1]: row for row in result.fetchall()}
-        
-        # Check if ride_id is nullable (notnull = 0 means nullable)
-        ride_id_nullable = columns.get('ride_id', [None, None, None, 1])[3] == 0
-        
-        # Add 'type' column if not exists
-        if 'type' not in columns:
-            print("\n[ ] Adding column: type (VARCHAR(20), default='info')")
-            with db.engine.connect() as conn:
+            
+            # Check if ride_id is nullable (notnull = 0 means nullable)
+            ride_id_nullable = columns.get('ride_id', [None, None, None, 1])[3] == 0
+            
+            # Add 'type' column if not exists
+            if 'type' not in columns:
+                print("\n[ ] Adding column: type (VARCHAR(20), default='info')")
                 conn.execute(db.text("ALTER TABLE notifications ADD COLUMN type VARCHAR(20) DEFAULT 'info'"))
-                conn.commit()
-            print("    ✓ Added type column")
-        else:
-            print("    ✓ Column 'type' already exists, skipping")
-        
-        # Make ride_id nullable if currently non-nullable
-        if 'ride_id' in columns and not ride_id_nullable:
-            print("\n[ ] Making ride_id nullable...")
-            # SQLite doesn't support ALTER COLUMN directly, need to recreate table
-            with db.engine.connect() as conn:
-                # Create new table with updated schema
+                print("    ✓ Added type column")
+            else:
+                print("    ✓ Column 'type' already exists, skipping")
+            
+            # Make ride_id nullable if currently non-nullable
+            if 'ride_id' in columns and not ride_id_nullable:
+                print("\n[ ] Making ride_id nullable...")
+                # SQLite doesn't support ALTER COLUMN directly, need to recreate table
                 conn.execute(db.text("""
                     CREATE TABLE notifications_new (
                         id INTEGER PRIMARY KEY,
@@ -65,7 +63,7 @@ def migrate():
                     )
                 """))
                 
-                # Copy data from old table
+                # Copy data from old table in one set-based statement
                 conn.execute(db.text("""
                     INSERT INTO notifications_new (id, employee_id, ride_id, message, is_read, created_at)
                     SELECT id, employee_id, ride_id, message, is_read, created_at FROM notifications
@@ -74,10 +72,9 @@ def migrate():
                 # Drop old table and rename new one
                 conn.execute(db.text("DROP TABLE notifications"))
                 conn.execute(db.text("ALTER TABLE notifications_new RENAME TO notifications"))
-                conn.commit()
-            print("    ✓ Made ride_id nullable (table recreated)")
-        else:
-            print("    ✓ ride_id is already nullable or doesn't exist, skipping")
+                print("    ✓ Made ride_id nullable (table recreated)")
+            else:
+                print("    ✓ ride_id is already nullable or doesn't exist, skipping")
         
         print(f"\n{'=' * 60}")
         print("✅ Migration complete!")
@@ -0,0 +1,32 @@
+"""add_composite_indexes_for_hot_queries
+
+Revision ID: 3c9a1f7d2b64
+Revises: 8dd634fd5814
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9a1f7d2b64'
+down_revision = '8dd634fd5814'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_rides_driver_departure', 'rides', ['driver_id', sa.text('departure_time DESC')])
+    op.create_index('ix_rides_status_seats', 'rides', ['status', 'available_seats'])
+    op.create_index('ix_reservations_employee_created', 'reservations', ['employee_id', sa.text('created_at DESC')])
+    op.create_index('ix_reservations_ride_status', 'reservations', ['ride_id', 'status'])
+    op.create_index('ix_notifications_employee_created', 'notifications', ['employee_id', sa.text('created_at DESC')])
+
+
+def downgrade():
+    op.drop_index('ix_notifications_employee_created', table_name='notifications')
+    op.drop_index('ix_reservations_ride_status', table_name='reservations')
+    op.drop_index('ix_reservations_employee_created', table_name='reservations')
+    op.drop_index('ix_rides_status_seats', table_name='rides')
+    op.drop_index('ix_rides_driver_departure', table_name='rides')
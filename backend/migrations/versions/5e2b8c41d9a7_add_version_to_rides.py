@@ -0,0 +1,26 @@
+"""add_version_to_rides
+
+Revision ID: 5e2b8c41d9a7
+Revises: 3c9a1f7d2b64
+Create Date: 2026-10-15 14:03:27.552941
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2b8c41d9a7'
+down_revision = '3c9a1f7d2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('rides', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('rides', schema=None) as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,31 @@
+"""add_partial_index_for_active_reservations
+
+Revision ID: 9a4d7e3f1c28
+Revises: 5e2b8c41d9a7
+Create Date: 2026-10-15 15:21:08.904317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4d7e3f1c28'
+down_revision = '5e2b8c41d9a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction; avoids locking writes on reservations
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_active', 'reservations', ['employee_id', 'ride_id'],
+            postgresql_where=sa.text("status IN ('PENDING', 'CONFIRMED')"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_reservations_active', table_name='reservations', postgresql_concurrently=True)
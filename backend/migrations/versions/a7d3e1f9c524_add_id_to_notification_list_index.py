@@ -0,0 +1,40 @@
+"""add_id_to_notification_list_index
+
+Revision ID: a7d3e1f9c524
+Revises: f2c6b8e4a913
+Create Date: 2026-10-15 23:58:41.207316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e1f9c524'
+down_revision = 'f2c6b8e4a913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_employee_created_id', 'notifications',
+            ['employee_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_notifications_employee_created', table_name='notifications', postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_employee_created', 'notifications',
+            ['employee_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_notifications_employee_created_id', table_name='notifications', postgresql_concurrently=True
+        )
@@ -0,0 +1,28 @@
+"""add_departure_id_index_on_rides
+
+Revision ID: b3e8f2a6d017
+Revises: a7d3e1f9c524
+Create Date: 2026-10-16 00:41:12.538904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e8f2a6d017'
+down_revision = 'a7d3e1f9c524'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rides_departure_id', 'rides', ['departure_time', 'id'], postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_rides_departure_id', table_name='rides', postgresql_concurrently=True)
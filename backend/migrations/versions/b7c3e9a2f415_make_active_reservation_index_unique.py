@@ -0,0 +1,69 @@
+"""make_active_reservation_index_unique
+
+Revision ID: b7c3e9a2f415
+Revises: 9a4d7e3f1c28
+Create Date: 2026-10-15 16:47:52.118036
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c3e9a2f415'
+down_revision = '9a4d7e3f1c28'
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUSES = sa.text("status IN ('PENDING', 'CONFIRMED')")
+
+
+def upgrade():
+    # Cancel duplicate active reservations left by past races. Each
+    # (employee, ride) keeps its CONFIRMED row if it has one, else the oldest;
+    # seats taken by a cancelled CONFIRMED duplicate go back to the ride, which
+    # reopens if it was FULL (same as cancelling a reservation through the API)
+    op.execute("""
+        WITH ranked AS (
+            SELECT id, status,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY employee_id, ride_id
+                       ORDER BY status = 'CONFIRMED' DESC, id
+                   ) AS position
+            FROM reservations
+            WHERE status IN ('PENDING', 'CONFIRMED')
+        ),
+        cancelled AS (
+            UPDATE reservations SET status = 'CANCELLED'
+            FROM ranked
+            WHERE reservations.id = ranked.id AND ranked.position > 1
+            RETURNING reservations.ride_id, reservations.seats_reserved, ranked.status AS previous_status
+        ),
+        released AS (
+            SELECT ride_id, SUM(seats_reserved) AS seats
+            FROM cancelled
+            WHERE previous_status = 'CONFIRMED'
+            GROUP BY ride_id
+        )
+        UPDATE rides SET
+            available_seats = rides.available_seats + released.seats,
+            status = CASE WHEN rides.status = 'FULL' THEN 'ACTIVE' ELSE rides.status END,
+            version = rides.version + 1
+        FROM released
+        WHERE rides.id = released.ride_id
+    """)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_reservations_active', 'reservations', ['employee_id', 'ride_id'], unique=True,
+            postgresql_where=ACTIVE_STATUSES, postgresql_concurrently=True
+        )
+        op.drop_index('ix_reservations_active', table_name='reservations', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_active', 'reservations', ['employee_id', 'ride_id'],
+            postgresql_where=ACTIVE_STATUSES, postgresql_concurrently=True
+        )
+        op.drop_index('uq_reservations_active', table_name='reservations', postgresql_concurrently=True)
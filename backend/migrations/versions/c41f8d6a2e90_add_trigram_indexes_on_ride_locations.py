@@ -0,0 +1,35 @@
+"""add_trigram_indexes_on_ride_locations
+
+Revision ID: c41f8d6a2e90
+Revises: b7c3e9a2f415
+Create Date: 2026-10-15 17:32:19.640275
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f8d6a2e90'
+down_revision = 'b7c3e9a2f415'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rides_origin_trgm', 'rides', ['origin'],
+            postgresql_using='gin', postgresql_ops={'origin': 'gin_trgm_ops'}, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_rides_destination_trgm', 'rides', ['destination'],
+            postgresql_using='gin', postgresql_ops={'destination': 'gin_trgm_ops'}, postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_rides_destination_trgm', table_name='rides', postgresql_concurrently=True)
+        op.drop_index('ix_rides_origin_trgm', table_name='rides', postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""add_coordinate_indexes_on_rides
+
+Revision ID: c5f1a9d3e286
+Revises: b3e8f2a6d017
+Create Date: 2026-10-16 01:17:53.640281
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5f1a9d3e286'
+down_revision = 'b3e8f2a6d017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rides_origin_coords', 'rides', ['origin_lat', 'origin_lng'], postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_rides_destination_coords', 'rides', ['destination_lat', 'destination_lng'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_rides_destination_coords', table_name='rides', postgresql_concurrently=True)
+        op.drop_index('ix_rides_origin_coords', table_name='rides', postgresql_concurrently=True)
@@ -0,0 +1,28 @@
+"""add_status_departure_index_on_rides
+
+Revision ID: e5a9d3c7b812
+Revises: c41f8d6a2e90
+Create Date: 2026-10-15 18:04:52.117930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a9d3c7b812'
+down_revision = 'c41f8d6a2e90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rides_status_departure', 'rides', ['status', 'departure_time'], postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_rides_status_departure', table_name='rides', postgresql_concurrently=True)
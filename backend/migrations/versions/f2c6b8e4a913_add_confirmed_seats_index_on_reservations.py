@@ -0,0 +1,31 @@
+"""add_confirmed_seats_index_on_reservations
+
+Revision ID: f2c6b8e4a913
+Revises: e5a9d3c7b812
+Create Date: 2026-10-15 18:26:07.483512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6b8e4a913'
+down_revision = 'e5a9d3c7b812'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reservations_ride_confirmed_seats', 'reservations', ['ride_id', 'seats_reserved'],
+            postgresql_where=sa.text("status = 'CONFIRMED'"), postgresql_concurrently=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_reservations_ride_confirmed_seats', table_name='reservations', postgresql_concurrently=True
+        )
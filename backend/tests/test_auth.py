@@ -106,6 +106,22 @@ class TestAuthLogin:
         assert response.status_code == 401
         assert response.json['error'] == 'UNAUTHORIZED'
     
+    def test_login_nonexistent_user_still_hashes(self, client, monkeypatch):
+        """Test an unknown email costs a password hash check like a wrong password."""
+        from app.api import auth
+
+        checked = []
+        real_check = auth.check_password_hash
+        monkeypatch.setattr(auth, 'check_password_hash', lambda h, p: checked.append(p) or real_check(h, p))
+
+        response = client.post('/auth/login', json={
+            'email': 'nobody@test.com',
+            'password': 'password123'
+        })
+
+        assert response.status_code == 401
+        assert checked == ['password123']
+
     def test_login_missing_fields(self, client):
         """Test login with missing fields fails."""
         response = client.post('/auth/login', json={
@@ -116,6 +132,42 @@ class TestAuthLogin:
         assert response.status_code == 400
         assert 'error' in response.json
 
+    def test_login_upgrades_outdated_hash(self, client, test_driver, app):
+        """Test a password hashed with another method is rehashed on login."""
+        from werkzeug.security import generate_password_hash
+        from app.extensions import db
+        from app.models import Employee
+
+        with app.app_context():
+            employee = db.session.get(Employee, test_driver.id)
+            employee.password_hash = generate_password_hash('testpass123', method='scrypt:1024:8:1')
+            db.session.commit()
+
+        response = client.post('/auth/login', json={
+            'email': test_driver.email,
+            'password': 'testpass123'
+        })
+
+        assert response.status_code == 200
+        with app.app_context():
+            employee = db.session.get(Employee, test_driver.id)
+            assert not employee.password_needs_rehash()
+            assert employee.check_password('testpass123')
+
+    def test_short_hash_method_spec_is_not_outdated(self, test_driver, app, monkeypatch):
+        """Test a method spec relying on werkzeug defaults matches its stored hashes."""
+        from werkzeug.security import generate_password_hash
+        from app.extensions import db
+        from app.models import Employee
+
+        monkeypatch.setitem(app.config, 'PASSWORD_HASH_METHOD', 'scrypt')
+        with app.app_context():
+            employee = db.session.get(Employee, test_driver.id)
+            employee.password_hash = generate_password_hash('testpass123', method='scrypt')
+
+            assert not employee.password_needs_rehash()
+            db.session.rollback()
+
 
 class TestAuthProtectedEndpoints:
     """Test authentication on protected endpoints."""
@@ -238,3 +238,50 @@ class TestRateLimitingConsiderations:
         
         # Should either accept or reject gracefully
         assert response.status_code in [201, 400, 413]  # Created, Bad Request, or Payload Too Large
+
+
+class TestAppFactory:
+    """Test the application factory can be called repeatedly."""
+
+    def test_repeated_app_creation_keeps_routes_unique(self, app):
+        """Test creating another app does not re-register routes on an existing one."""
+        from app import create_app
+        from app.api import init_api
+
+        rules_before = len(list(app.url_map.iter_rules()))
+        other = create_app('testing')
+        init_api(other)
+
+        assert len(list(app.url_map.iter_rules())) == rules_before
+        assert len(list(other.url_map.iter_rules())) == rules_before
+
+    def test_repeated_app_creation_keeps_single_error_handler(self, app):
+        """Test the shared Api's error handler is not wrapped again per app."""
+        from app import create_app
+        from app.extensions import api
+
+        handler = api.handle_error
+        create_app('testing')
+
+        assert api.handle_error is handler
+
+
+class TestDatabaseErrors:
+    """Test database failures surface as standardized 500 responses."""
+
+    def test_database_error_returns_internal_error(self, client, auth_headers_passenger, sample_ride, monkeypatch):
+        """Test a failing commit returns INTERNAL_ERROR without SQL details."""
+        from sqlalchemy.exc import OperationalError
+        from app.extensions import db
+
+        def failing_commit():
+            raise OperationalError('INSERT INTO reservations', {}, Exception('connection lost'))
+
+        monkeypatch.setattr(db.session, 'commit', failing_commit)
+        response = client.post('/reservations/', headers=auth_headers_passenger, json={
+            'ride_id': sample_ride.id,
+            'seats_reserved': 1
+        })
+
+        assert response.status_code == 500
+        assert response.json == {'error': 'INTERNAL_ERROR', 'message': 'Database error'}
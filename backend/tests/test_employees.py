@@ -0,0 +1,171 @@
+"""Employee endpoint tests.
+
+Tests the current employee's rides, reservations, and activity history.
+"""
+import pytest
+
+
+class TestMyHistory:
+    """Test the combined activity timeline endpoint."""
+
+    def test_history_requires_auth(self, client):
+        """Test history without authentication fails."""
+        response = client.get('/employees/me/history')
+
+        assert response.status_code == 401
+
+    def test_history_includes_driven_rides(self, client, auth_headers_driver, sample_ride, app):
+        """Test rides offered by the driver appear in their history."""
+        from app.extensions import db
+        from app.models import Ride
+
+        response = client.get('/employees/me/history', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        items = [i for i in response.json if i['ride_id'] == sample_ride.id]
+        assert len(items) == 1
+        assert items[0]['type'] == 'DRIVER_RIDE'
+        assert items[0]['origin'] == sample_ride.origin
+        with app.app_context():
+            departure_time = db.session.get(Ride, sample_ride.id).departure_time
+        assert items[0]['departure_time'] == departure_time.isoformat()
+
+    def test_history_includes_reservations(self, client, auth_headers_passenger, sample_reservation):
+        """Test reservations made by the passenger appear in their history."""
+        response = client.get('/employees/me/history', headers=auth_headers_passenger)
+
+        assert response.status_code == 200
+        items = [i for i in response.json if i['ride_id'] == sample_reservation.ride_id]
+        assert len(items) == 1
+        assert items[0]['type'] == 'RESERVATION'
+
+    def test_history_sorted_newest_first(self, client, auth_headers_driver, sample_ride):
+        """Test history items are ordered by departure time, newest first."""
+        response = client.get('/employees/me/history', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        departures = [i['departure_time'] for i in response.json]
+        assert departures == sorted(departures, reverse=True)
+
+    def test_history_paginated(self, client, auth_headers_driver, sample_ride):
+        """Test page/per_page are applied to the combined timeline."""
+        full = client.get('/employees/me/history', headers=auth_headers_driver).json
+        response = client.get('/employees/me/history?page=1&per_page=1', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        assert response.json == full[:1]
+
+    def test_history_unpaginated_is_capped(self, client, auth_headers_driver, test_driver, app, monkeypatch):
+        """Test history without page params returns only the latest items."""
+        from datetime import datetime, timedelta
+        from app.api import employees
+        from app.extensions import db
+        from app.models import Ride
+
+        with app.app_context():
+            for i in range(3):
+                db.session.add(Ride(
+                    driver_id=test_driver.id,
+                    origin=f'History {i}',
+                    destination='Tunis',
+                    departure_time=datetime.now() + timedelta(days=i + 1),
+                    available_seats=2,
+                    status='ACTIVE'
+                ))
+            db.session.commit()
+        monkeypatch.setattr(employees, 'HISTORY_DEFAULT_LIMIT', 2)
+
+        response = client.get('/employees/me/history', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        assert [i['origin'] for i in response.json] == ['History 2', 'History 1']
+
+
+class TestMyRides:
+    """Test the current employee's offered rides list."""
+
+    def test_my_rides_full_timestamps(self, client, auth_headers_driver, sample_ride, app):
+        """Test ride timestamps keep their fractional seconds."""
+        from datetime import datetime
+        from app.extensions import db
+        from app.models import Ride
+
+        with app.app_context():
+            ride = db.session.get(Ride, sample_ride.id)
+            ride.departure_time = datetime(2030, 1, 2, 3, 4, 5, 123456)
+            db.session.commit()
+            created_at = ride.created_at.isoformat()
+
+        response = client.get('/employees/me/rides', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        item = next(i for i in response.json if i['id'] == sample_ride.id)
+        assert item['departure_time'] == '2030-01-02T03:04:05.123456'
+        assert item['created_at'] == created_at
+
+
+class TestMyReservations:
+    """Test the current employee's reservation list."""
+
+    def test_my_reservations_paginated(self, client, auth_headers_passenger, sample_reservation):
+        """Test page/per_page limit the returned reservations."""
+        response = client.get('/employees/me/reservations?page=1&per_page=1', headers=auth_headers_passenger)
+
+        assert response.status_code == 200
+        assert len(response.json) == 1
+        assert response.json[0]['id'] == sample_reservation.id
+
+    def test_my_reservations_full_timestamps(self, client, auth_headers_passenger, sample_reservation, app):
+        """Test reservation created_at keeps its fractional seconds."""
+        from datetime import datetime
+        from app.extensions import db
+        from app.models import Reservation
+
+        with app.app_context():
+            db.session.get(Reservation, sample_reservation.id).created_at = datetime(2026, 1, 2, 3, 4, 5, 120000)
+            db.session.commit()
+
+        response = client.get('/employees/me/reservations', headers=auth_headers_passenger)
+
+        assert response.status_code == 200
+        assert response.json[0]['created_at'] == '2026-01-02T03:04:05.120000'
+
+    def test_my_reservations_invalid_page(self, client, auth_headers_passenger):
+        """Test invalid pagination parameters return a validation error."""
+        response = client.get('/employees/me/reservations?page=0', headers=auth_headers_passenger)
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
+
+class TestUserProfile:
+    """Test the current employee's cached profile."""
+
+    def test_profile_reflects_updates(self, client, auth_headers_driver):
+        """Test the cached profile is refreshed after profile edits and new rides."""
+        before = client.get('/employees/me', headers=auth_headers_driver).json
+
+        client.patch('/users/me', headers=auth_headers_driver, json={'car_color': 'Blue'})
+        client.post('/rides/', headers=auth_headers_driver, json={
+            'origin': 'Profile origin',
+            'destination': 'Profile destination',
+            'departure_time': '2030-01-01T08:00:00',
+            'available_seats': 2
+        })
+        response = client.get('/employees/me', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        assert response.json['car_color'] == 'Blue'
+        assert response.json['rides_offered_count'] == before['rides_offered_count'] + 1
+
+    def test_profile_update_ignores_other_fields(self, client, auth_headers_driver, test_driver):
+        """Test PATCH only writes the editable profile fields."""
+        response = client.patch('/employees/me', headers=auth_headers_driver, json={
+            'phone_number': '+216 20 000 000',
+            'email': 'hijack@test.com',
+            'role': 'admin'
+        })
+
+        assert response.status_code == 200
+        assert response.json['phone_number'] == '+216 20 000 000'
+        assert response.json['email'] == test_driver.email
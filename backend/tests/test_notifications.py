@@ -36,6 +36,73 @@ class TestNotificationList:
         assert response.status_code == 401
         assert response.json['error'] == 'UNAUTHORIZED'
 
+    def test_list_own_notifications_keyset_pagination(self, client, auth_headers_passenger, test_passenger, app):
+        """Test limit/before_id page through notifications newest first."""
+        from app.models import Notification
+        from app.extensions import db
+
+        with app.app_context():
+            for i in range(3):
+                db.session.add(Notification(
+                    employee_id=test_passenger.id,
+                    message=f'Paged notification {i}',
+                    is_read=False
+                ))
+            db.session.commit()
+
+        first_page = client.get('/notifications/?limit=2', headers=auth_headers_passenger)
+
+        assert first_page.status_code == 200
+        assert len(first_page.json) == 2
+        assert first_page.json[0]['id'] > first_page.json[1]['id']
+
+        cursor = first_page.json[-1]['id']
+        second_page = client.get(f'/notifications/?limit=2&before_id={cursor}', headers=auth_headers_passenger)
+
+        assert second_page.status_code == 200
+        assert len(second_page.json) == 1
+        assert second_page.json[0]['id'] < cursor
+
+    def test_list_own_notifications_full_timestamps(self, client, auth_headers_passenger, test_passenger, app):
+        """Test notification created_at keeps its fractional seconds."""
+        from datetime import datetime
+        from app.models import Notification
+        from app.extensions import db
+
+        with app.app_context():
+            db.session.add(Notification(
+                employee_id=test_passenger.id,
+                message='Timestamped notification',
+                is_read=False,
+                created_at=datetime(2026, 1, 2, 3, 4, 5, 123456)
+            ))
+            db.session.commit()
+
+        response = client.get('/notifications/', headers=auth_headers_passenger)
+
+        assert response.status_code == 200
+        assert response.json[0]['created_at'] == '2026-01-02T03:04:05.123456'
+
+    def test_list_own_notifications_reflects_new_and_read(self, client, auth_headers_driver, auth_headers_passenger, test_passenger):
+        """Test the cached notification list is refreshed after writes."""
+        headers = auth_headers_passenger
+
+        assert client.get('/notifications/', headers=headers).json == []
+
+        client.post('/notifications/', headers=auth_headers_driver, json={
+            'employee_id': test_passenger.id,
+            'message': 'Cached list notification'
+        })
+        response = client.get('/notifications/', headers=headers)
+
+        assert [n['message'] for n in response.json] == ['Cached list notification']
+        assert response.json[0]['is_read'] == False
+
+        client.post('/notifications/mark-all-read', headers=headers)
+        response = client.get('/notifications/', headers=headers)
+
+        assert response.json[0]['is_read'] == True
+
 
 class TestNotificationCreate:
     """Test notification creation endpoints."""
@@ -119,3 +186,33 @@ class TestNotificationDelete:
         
         assert response.status_code == 200
         assert 'deleted successfully' in response.json['message']
+
+    def test_delete_other_employees_notification(self, client, auth_headers_passenger, test_driver, app):
+        """Test deleting another employee's notification is forbidden."""
+        from app.models import Notification
+        from app.extensions import db
+
+        with app.app_context():
+            notification = Notification(
+                employee_id=test_driver.id,
+                message='Driver only notification',
+                is_read=False
+            )
+            db.session.add(notification)
+            db.session.commit()
+            notification_id = notification.id
+
+        response = client.delete(f'/notifications/{notification_id}', headers=auth_headers_passenger)
+
+        assert response.status_code == 403
+        assert response.json['error'] == 'FORBIDDEN'
+
+        with app.app_context():
+            assert db.session.get(Notification, notification_id) is not None
+
+    def test_delete_nonexistent_notification(self, client, auth_headers_driver):
+        """Test deleting a non-existent notification returns 404."""
+        response = client.delete('/notifications/99999', headers=auth_headers_driver)
+
+        assert response.status_code == 404
+        assert response.json['error'] == 'NOT_FOUND'
@@ -21,7 +21,25 @@ class TestReservationCreate:
         assert response.json['status'] == 'PENDING'
         assert response.json['seats_reserved'] == 1
         assert response.json['ride_id'] == sample_ride.id
-    
+
+    def test_create_reservation_notifies_driver_and_logs_event(self, client, auth_headers_passenger, sample_ride, test_passenger, app):
+        """Test booking creates the driver notification and a linked system event."""
+        from app.models import Notification, SystemEvent
+
+        response = client.post('/reservations/', headers=auth_headers_passenger, json={
+            'ride_id': sample_ride.id,
+            'seats_reserved': 1
+        })
+
+        assert response.status_code == 201
+        reservation_id = response.json['id']
+        with app.app_context():
+            assert Notification.query.filter_by(
+                employee_id=sample_ride.driver_id, ride_id=sample_ride.id, type='request'
+            ).count() == 1
+            event = SystemEvent.query.filter_by(event_type='RESERVATION_REQUESTED', ride_id=sample_ride.id).one()
+            assert event.reservation_id == reservation_id
+
     def test_create_reservation_invalid_seats(self, client, auth_headers_passenger, sample_ride, test_passenger):
         """Test creating reservation with 0 seats fails."""
         response = client.post('/reservations/', headers=auth_headers_passenger, json={
@@ -54,6 +72,63 @@ class TestReservationCreate:
         # Just check error field exists, message format may vary
         assert 'error' in response.json or 'message' in response.json
     
+    def test_create_reservation_other_integrity_error_not_reported_as_duplicate(
+            self, client, auth_headers_passenger, sample_ride, test_passenger, monkeypatch):
+        """Test only uq_reservations_active violations become the duplicate error."""
+        import sqlite3
+        from sqlalchemy.exc import IntegrityError
+        from app.extensions import db
+
+        def failing_commit():
+            raise IntegrityError(
+                'INSERT INTO reservations ...', {},
+                sqlite3.IntegrityError('NOT NULL constraint failed: reservations.seats_reserved')
+            )
+
+        monkeypatch.setattr(db.session, 'commit', failing_commit)
+
+        response = client.post('/reservations/', headers=auth_headers_passenger, json={
+            'employee_id': test_passenger.id,
+            'ride_id': sample_ride.id,
+            'seats_reserved': 1
+        })
+
+        assert response.status_code == 500
+        assert response.json['error'] == 'INTERNAL_ERROR'
+        assert 'active reservation' not in response.json['message']
+    
+    def test_create_reservation_after_missed_boarding_fails(self, client, auth_headers_passenger, sample_ride, test_passenger, app):
+        """Test a passenger who missed boarding cannot request the same ride again."""
+        from app.models import Reservation
+        from app.extensions import db
+
+        with app.app_context():
+            db.session.add(Reservation(
+                employee_id=test_passenger.id,
+                ride_id=sample_ride.id,
+                seats_reserved=1,
+                status='MISSED'
+            ))
+            db.session.commit()
+
+        response = client.post('/reservations/', headers=auth_headers_passenger, json={
+            'ride_id': sample_ride.id,
+            'seats_reserved': 1
+        })
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
+    def test_create_reservation_ride_not_found(self, client, auth_headers_passenger):
+        """Test requesting a seat on a non-existent ride returns 404."""
+        response = client.post('/reservations/', headers=auth_headers_passenger, json={
+            'ride_id': 99999,
+            'seats_reserved': 1
+        })
+
+        assert response.status_code == 404
+        assert response.json['error'] == 'NOT_FOUND'
+    
     def test_create_reservation_overbooking_fails(self, client, auth_headers_passenger, sample_ride, test_passenger):
         """Test reserving more seats than available fails."""
         response = client.post('/reservations/', headers=auth_headers_passenger, json={
@@ -91,6 +166,57 @@ class TestReservationApprove:
         assert response.status_code == 200
         assert response.json['status'] == 'CONFIRMED'
     
+    def test_approve_reservation_takes_last_seats(self, client, auth_headers_driver, sample_ride, test_passenger, app):
+        """Test approving a booking for all remaining seats marks the ride FULL."""
+        from app.models import Reservation, Ride
+        from app.extensions import db
+
+        with app.app_context():
+            reservation = Reservation(
+                employee_id=test_passenger.id,
+                ride_id=sample_ride.id,
+                seats_reserved=sample_ride.available_seats,
+                status='PENDING'
+            )
+            db.session.add(reservation)
+            db.session.commit()
+            reservation_id = reservation.id
+            initial_version = db.session.get(Ride, sample_ride.id).version
+
+        response = client.patch(f'/reservations/{reservation_id}/approve', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        with app.app_context():
+            ride = db.session.get(Ride, sample_ride.id)
+            assert ride.available_seats == 0
+            assert ride.status == 'FULL'
+            assert ride.version == initial_version + 1
+
+    def test_approve_reservation_not_enough_seats(self, client, auth_headers_driver, sample_ride, test_passenger, app):
+        """Test approval fails without changing seats when the ride cannot fit the booking."""
+        from app.models import Reservation, Ride
+        from app.extensions import db
+
+        with app.app_context():
+            reservation = Reservation(
+                employee_id=test_passenger.id,
+                ride_id=sample_ride.id,
+                seats_reserved=sample_ride.available_seats + 1,
+                status='PENDING'
+            )
+            db.session.add(reservation)
+            db.session.commit()
+            reservation_id = reservation.id
+
+        response = client.patch(f'/reservations/{reservation_id}/approve', headers=auth_headers_driver)
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+        with app.app_context():
+            ride = db.session.get(Ride, sample_ride.id)
+            assert ride.available_seats == sample_ride.available_seats
+            assert db.session.get(Reservation, reservation_id).status == 'PENDING'
+
     def test_approve_reservation_unauthorized(self, client, auth_headers_passenger, sample_reservation):
         """Test passenger cannot approve their own reservation."""
         response = client.patch(f'/reservations/{sample_reservation.id}/approve', headers=auth_headers_passenger)
@@ -231,6 +357,56 @@ class TestReservationList:
         assert response.status_code == 200
         assert isinstance(response.json, list)
     
+    def test_list_reservations_with_ride_details(self, client, auth_headers_passenger, sample_reservation, sample_ride, test_driver):
+        """Test include_ride returns each reservation with its ride and driver."""
+        response = client.get(
+            f'/reservations/?include_ride=true&employee_id={sample_reservation.employee_id}',
+            headers=auth_headers_passenger
+        )
+
+        assert response.status_code == 200
+        items = [r for r in response.json if r['id'] == sample_reservation.id]
+        assert len(items) == 1
+        assert items[0]['ride']['id'] == sample_ride.id
+        assert items[0]['ride']['driver']['id'] == test_driver.id
+        assert items[0]['ride']['driver_name'] == items[0]['ride']['driver']['name']
+
+    def test_list_reservations_streamed(self, client, auth_headers_passenger, sample_reservation):
+        """Test stream=1 returns the same list as the buffered response."""
+        url = f'/reservations/?employee_id={sample_reservation.employee_id}'
+        buffered = client.get(url, headers=auth_headers_passenger)
+        streamed = client.get(f'{url}&stream=1', headers=auth_headers_passenger)
+
+        assert streamed.status_code == 200
+        assert streamed.is_streamed
+        assert streamed.json == buffered.json
+        assert [r['id'] for r in streamed.json] == [sample_reservation.id]
+    
+    @pytest.mark.parametrize('created_at', [
+        datetime(2026, 1, 2, 3, 4, 5, 123456),
+        datetime(2026, 1, 2, 3, 4, 5)
+    ])
+    def test_list_reservations_timestamps_match_marshalled(self, client, auth_headers_passenger,
+                                                           sample_reservation, app, created_at):
+        """Test SQL-formatted list timestamps equal the marshalled single-object output."""
+        from flask_restx import marshal
+        from app.api.reservations import reservation_response
+        from app.extensions import db
+        from app.models import Reservation
+
+        with app.app_context():
+            reservation = db.session.get(Reservation, sample_reservation.id)
+            reservation.created_at = created_at
+            db.session.commit()
+            expected = marshal(reservation, reservation_response)['created_at']
+
+        response = client.get(
+            f'/reservations/?employee_id={sample_reservation.employee_id}', headers=auth_headers_passenger
+        )
+
+        assert response.status_code == 200
+        assert response.json[0]['created_at'] == expected == created_at.isoformat()
+    
     def test_list_reservations_without_auth(self, client):
         """Test listing reservations without authentication fails."""
         response = client.get('/reservations/')
@@ -27,6 +27,130 @@ class TestRideList:
         if response.json['items']:
             assert response.json['items'][0]['origin'] == 'Downtown'
     
+    def test_list_rides_includes_driver_and_reservations(self, client, auth_headers_driver, test_driver,
+                                                         sample_ride, sample_reservation):
+        """Test each listed ride carries its driver and embedded reservations."""
+        response = client.get(f'/rides/?driver_id={test_driver.id}&per_page=50', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        item = next(i for i in response.json['items'] if i['id'] == sample_ride.id)
+        assert item['driver_name'] is not None
+        assert [r['id'] for r in item['reservations']] == [sample_reservation.id]
+        assert item['reservations'][0]['passenger_name'] is not None
+
+    def test_list_rides_cached_page_reflects_changes(self, client, auth_headers_driver, test_driver,
+                                                     sample_ride, sample_reservation):
+        """Test a cached ride list is refreshed after new rides and approvals."""
+        url = f'/rides/?driver_id={test_driver.id}&per_page=50'
+        before = client.get(url, headers=auth_headers_driver).json
+
+        assert client.get(url, headers=auth_headers_driver).json == before
+
+        client.post('/rides/', headers=auth_headers_driver, json={
+            'origin': 'Cached list origin',
+            'destination': 'Cached list destination',
+            'departure_time': '2030-01-01T08:00:00',
+            'available_seats': 2
+        })
+        client.patch(f'/reservations/{sample_reservation.id}/approve', headers=auth_headers_driver)
+        after = client.get(url, headers=auth_headers_driver).json
+
+        assert after['total_items'] == before['total_items'] + 1
+        item = next(i for i in after['items'] if i['id'] == sample_ride.id)
+        assert item['reservations'][0]['status'] == 'CONFIRMED'
+
+    def test_list_rides_cached_page_reflects_driver_profile(self, client, auth_headers_driver, test_driver,
+                                                            sample_ride):
+        """Test a cached ride list picks up the driver's edited car details."""
+        url = f'/rides/?driver_id={test_driver.id}&per_page=50'
+        client.get(url, headers=auth_headers_driver)
+
+        client.patch('/users/me', headers=auth_headers_driver, json={'car_color': 'Cached Green'})
+        response = client.get(url, headers=auth_headers_driver)
+
+        item = next(i for i in response.json['items'] if i['id'] == sample_ride.id)
+        assert item['driver_car_color'] == 'Cached Green'
+
+    def test_list_rides_reversed_date_range(self, client, auth_headers_driver):
+        """Test date_from later than date_to returns a validation error."""
+        response = client.get('/rides/?date_from=2030-02-10&date_to=2030-02-01', headers=auth_headers_driver)
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
+    def test_list_rides_status_and_upcoming_filters(self, client, auth_headers_driver, test_driver, sample_ride):
+        """Test status/upcoming narrow the list in SQL."""
+        base = f'/rides/?driver_id={test_driver.id}&per_page=50'
+
+        upcoming = client.get(f'{base}&status=ACTIVE&upcoming=1', headers=auth_headers_driver)
+        completed = client.get(f'{base}&status=completed', headers=auth_headers_driver)
+
+        assert upcoming.status_code == 200
+        assert sample_ride.id in [i['id'] for i in upcoming.json['items']]
+        assert all(i['status'] == 'ACTIVE' for i in upcoming.json['items'])
+        assert sample_ride.id not in [i['id'] for i in completed.json['items']]
+
+    def test_list_rides_invalid_status(self, client, auth_headers_driver):
+        """Test an unknown status filter returns a validation error."""
+        response = client.get('/rides/?status=teleported', headers=auth_headers_driver)
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
+    def test_list_rides_coordinate_search(self, client, auth_headers_driver):
+        """Test coordinate search returns rides within the pickup radius only."""
+        departure_time = (datetime.now() + timedelta(days=1)).isoformat()
+        ids = {}
+        for name, lat in (('near', 36.80), ('far', 37.50)):
+            response = client.post('/rides/', headers=auth_headers_driver, json={
+                'origin': f'Geo {name}',
+                'destination': 'Geo destination',
+                'origin_lat': lat,
+                'origin_lng': 10.18,
+                'departure_time': departure_time,
+                'available_seats': 2
+            })
+            ids[name] = response.json['id']
+
+        response = client.get('/rides/?origin_lat=36.81&origin_lng=10.18&per_page=50', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        found = [i['id'] for i in response.json['items']]
+        assert ids['near'] in found
+        assert ids['far'] not in found
+
+    def test_list_rides_cursor_pagination(self, client, auth_headers_driver):
+        """Test cursor pagination walks all rides in order without repeats."""
+        departure_time = (datetime.now() + timedelta(days=3)).isoformat()
+        created = []
+        for i in range(3):
+            response = client.post('/rides/', headers=auth_headers_driver, json={
+                'origin': f'Cursor {i}',
+                'destination': 'Cursor destination',
+                'departure_time': departure_time,
+                'available_seats': 2
+            })
+            created.append(response.json['id'])
+
+        seen = []
+        cursor = ''
+        while cursor is not None:
+            response = client.get(f'/rides/?per_page=2&cursor={cursor}', headers=auth_headers_driver)
+            assert response.status_code == 200
+            assert 'total_items' not in response.json
+            seen.extend(i['id'] for i in response.json['items'])
+            cursor = response.json['next_cursor']
+
+        assert len(seen) == len(set(seen))
+        assert [i for i in seen if i in created] == created
+
+    def test_list_rides_invalid_cursor(self, client, auth_headers_driver):
+        """Test a malformed cursor returns a validation error."""
+        response = client.get('/rides/?cursor=not-a-cursor', headers=auth_headers_driver)
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
     def test_list_rides_pagination(self, client, auth_headers_driver):
         """Test ride pagination parameters."""
         response = client.get('/rides/?page=1&per_page=5', headers=auth_headers_driver)
@@ -64,6 +188,24 @@ class TestRideCreate:
         assert response.json['available_seats'] == 3
         assert response.json['status'] == 'ACTIVE'
     
+    def test_create_ride_logs_event_with_ride_id(self, client, auth_headers_driver, test_driver, app):
+        """Test ride creation logs a RIDE_CREATED event linked to the new ride."""
+        from app.models import SystemEvent
+        
+        departure_time = (datetime.now() + timedelta(days=1)).isoformat()
+        response = client.post('/rides/', headers=auth_headers_driver, json={
+            'origin': 'Event Origin',
+            'destination': 'Event Destination',
+            'departure_time': departure_time,
+            'available_seats': 2
+        })
+        
+        assert response.status_code == 201
+        with app.app_context():
+            event = SystemEvent.query.filter_by(event_type='RIDE_CREATED', ride_id=response.json['id']).one()
+            assert 'Event Origin' in event.message
+            assert event.message.startswith(test_driver.name)
+    
     def test_create_ride_invalid_seats(self, client, auth_headers_driver, test_driver):
         """Test creating ride with invalid seats fails."""
         departure_time = (datetime.now() + timedelta(days=1)).isoformat()
@@ -79,6 +221,32 @@ class TestRideCreate:
         assert response.status_code == 400
         assert response.json['error'] == 'VALIDATION_ERROR'
     
+    def test_create_ride_invalid_departure_time(self, client, auth_headers_driver):
+        """Test creating ride with a malformed departure time fails."""
+        response = client.post('/rides/', headers=auth_headers_driver, json={
+            'origin': 'City Center',
+            'destination': 'Suburbs',
+            'departure_time': 'tomorrow morning',
+            'available_seats': 2
+        })
+        
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+    
+    def test_create_ride_utc_offset_departure_time(self, client, auth_headers_driver):
+        """Test departure times with a UTC offset are accepted."""
+        departure_time = (datetime.utcnow() + timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        response = client.post('/rides/', headers=auth_headers_driver, json={
+            'origin': 'City Center',
+            'destination': 'Suburbs',
+            'departure_time': departure_time,
+            'available_seats': 2
+        })
+        
+        assert response.status_code == 201
+        assert response.json['departure_time'].startswith(departure_time[:-1])
+    
     def test_create_ride_missing_fields(self, client, auth_headers_driver):
         """Test creating ride with missing fields fails."""
         response = client.post('/rides/', headers=auth_headers_driver, json={
@@ -119,6 +287,47 @@ class TestRideDetail:
         assert response.json['origin'] == 'Updated Origin'
         assert response.json['available_seats'] == 5
     
+    def test_update_ride_seats_below_reserved(self, client, auth_headers_driver, sample_ride, confirmed_reservation):
+        """Test seats cannot be set below the seats held by confirmed reservations."""
+        response = client.put(f'/rides/{sample_ride.id}', headers=auth_headers_driver, json={
+            'available_seats': 0
+        })
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
+    def test_update_ride_retries_on_concurrent_change(self, client, auth_headers_driver, sample_ride, monkeypatch):
+        """Test a ride update re-runs when a concurrent write bumped the ride version."""
+        from sqlalchemy.orm.exc import StaleDataError
+        from app.extensions import db
+
+        real_commit = db.session.commit
+        commits = []
+
+        def commit_conflicting_once():
+            commits.append(True)
+            if len(commits) == 1:
+                raise StaleDataError('rides row was updated concurrently')
+            real_commit()
+
+        monkeypatch.setattr(db.session, 'commit', commit_conflicting_once)
+        response = client.put(f'/rides/{sample_ride.id}', headers=auth_headers_driver, json={
+            'available_seats': 5
+        })
+
+        assert response.status_code == 200
+        assert response.json['available_seats'] == 5
+        assert len(commits) == 2
+
+    def test_update_ride_invalid_departure_time(self, client, auth_headers_driver, sample_ride):
+        """Test a malformed departure_time on update returns a validation error."""
+        response = client.put(f'/rides/{sample_ride.id}', headers=auth_headers_driver, json={
+            'departure_time': 'next tuesday'
+        })
+
+        assert response.status_code == 400
+        assert response.json['error'] == 'VALIDATION_ERROR'
+
     def test_update_ride_unauthorized(self, client, auth_headers_passenger, sample_ride):
         """Test passenger cannot update driver's ride."""
         response = client.put(f'/rides/{sample_ride.id}', headers=auth_headers_passenger, json={
@@ -159,6 +368,23 @@ class TestRideComplete:
         assert response.status_code == 200
         assert response.json['status'] == 'COMPLETED'
     
+    def test_complete_ride_completes_confirmed_reservations(self, client, auth_headers_driver, sample_ride,
+                                                            confirmed_reservation, app):
+        """Test completing an in-progress ride completes its confirmed reservations."""
+        from app.models import Reservation, Ride
+        from app.extensions import db
+
+        with app.app_context():
+            db.session.get(Ride, sample_ride.id).status = 'in_progress'
+            db.session.commit()
+
+        response = client.patch(f'/rides/{sample_ride.id}/complete', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        assert response.json['status'] == 'completed'
+        with app.app_context():
+            assert db.session.get(Reservation, confirmed_reservation.id).status == 'COMPLETED'
+    
     def test_complete_ride_unauthorized(self, client, auth_headers_passenger, sample_ride):
         """Test passenger cannot complete driver's ride."""
         response = client.patch(f'/rides/{sample_ride.id}/complete', headers=auth_headers_passenger)
@@ -178,6 +404,38 @@ class TestRideComplete:
         assert response.json['error'] == 'VALIDATION_ERROR'
 
 
+class TestRideCancel:
+    """Test ride cancellation endpoint."""
+
+    def test_cancel_ride_cancels_reservations_and_notifies(self, client, auth_headers_driver, sample_ride,
+                                                           confirmed_reservation, app):
+        """Test cancelling a ride cancels active bookings and notifies each passenger."""
+        from app.models import Reservation, Notification
+        from app.extensions import db
+
+        response = client.patch(f'/rides/{sample_ride.id}/cancel', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        with app.app_context():
+            reservation = db.session.get(Reservation, confirmed_reservation.id)
+            assert reservation.status == 'CANCELLED'
+            assert Notification.query.filter_by(
+                employee_id=confirmed_reservation.employee_id, ride_id=sample_ride.id, type='cancellation'
+            ).count() == 1
+
+    def test_cancel_ride_refreshes_passenger_notification_list(self, client, auth_headers_driver,
+                                                               auth_headers_passenger, sample_ride,
+                                                               confirmed_reservation):
+        """Test the passenger's cached notification list shows the cancellation."""
+        before = client.get('/notifications/', headers=auth_headers_passenger).json
+
+        client.patch(f'/rides/{sample_ride.id}/cancel', headers=auth_headers_driver)
+        after = client.get('/notifications/', headers=auth_headers_passenger).json
+
+        assert len(after) == len(before) + 1
+        assert after[0]['type'] == 'cancellation'
+
+
 class TestRideParticipants:
     """Test ride participants endpoint."""
     
@@ -194,3 +452,18 @@ class TestRideParticipants:
         
         assert response.status_code == 403
         assert response.json['error'] == 'FORBIDDEN'
+
+    def test_get_participants_ride_not_found(self, client, auth_headers_driver):
+        """Test participants of a non-existent ride returns 404."""
+        response = client.get('/rides/99999/participants', headers=auth_headers_driver)
+
+        assert response.status_code == 404
+        assert response.json['error'] == 'NOT_FOUND'
+
+    def test_get_pending_requests_as_driver(self, client, auth_headers_driver, sample_ride, sample_reservation):
+        """Test driver sees pending booking requests for their ride."""
+        response = client.get(f'/rides/{sample_ride.id}/pending-requests', headers=auth_headers_driver)
+
+        assert response.status_code == 200
+        assert [r['employee_id'] for r in response.json] == [sample_reservation.employee_id]
+        assert response.json[0]['status'] == 'PENDING'